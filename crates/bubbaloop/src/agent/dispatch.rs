@@ -97,25 +97,38 @@ impl<P: PlatformOperations> Dispatcher<P> {
     }
 
     /// Returns Claude-compatible tool definitions for all 37 MCP tools.
-    pub fn tool_definitions() -> Vec<ToolDefinition> {
-        let empty_object = json!({
-            "type": "object",
-            "properties": {},
-            "required": []
-        });
+    ///
+    /// Built once on first call and cached for the process lifetime — the
+    /// definitions are static data but building them allocates dozens of
+    /// strings and JSON schemas, and this runs on every agent turn.
+    pub fn tool_definitions() -> &'static [ToolDefinition] {
+        static TOOL_DEFINITIONS: std::sync::LazyLock<Vec<ToolDefinition>> =
+            std::sync::LazyLock::new(build_tool_definitions);
+        &TOOL_DEFINITIONS
+    }
+}
 
-        let node_name_schema = json!({
-            "type": "object",
-            "properties": {
-                "node_name": {
-                    "type": "string",
-                    "description": "Name of the node (e.g., \"rtsp-camera\", \"openmeteo\")"
-                }
-            },
-            "required": ["node_name"]
-        });
+/// Builds the full tool definition list. Called exactly once, by the
+/// `LazyLock` in [`Dispatcher::tool_definitions`].
+fn build_tool_definitions() -> Vec<ToolDefinition> {
+    let empty_object = json!({
+        "type": "object",
+        "properties": {},
+        "required": []
+    });
+
+    let node_name_schema = json!({
+        "type": "object",
+        "properties": {
+            "node_name": {
+                "type": "string",
+                "description": "Name of the node (e.g., \"rtsp-camera\", \"openmeteo\")"
+            }
+        },
+        "required": ["node_name"]
+    });
 
-        vec![
+    vec![
             // ── No-parameter tools ──────────────────────────────────
             ToolDefinition {
                 name: "list_nodes".to_string(),
@@ -662,8 +675,9 @@ impl<P: PlatformOperations> Dispatcher<P> {
                 }),
             },
         ]
-    }
+}
 
+impl<P: PlatformOperations> Dispatcher<P> {
     /// Dispatch a tool call by name, returning a `ContentBlock::ToolResult`.
     pub async fn call_tool(&self, tool_use_id: &str, name: &str, input: &Value) -> ContentBlock {
         let result = match name {
@@ -741,15 +755,18 @@ impl<P: PlatformOperations> Dispatcher<P> {
         match self.platform.list_nodes().await {
             Ok(nodes) if nodes.is_empty() => "No nodes registered.".to_string(),
             Ok(nodes) => {
-                let mut lines = Vec::with_capacity(nodes.len() + 1);
-                lines.push(format!("{} node(s) registered:", nodes.len()));
+                use std::fmt::Write as _;
+                // Write every line into one buffer — no per-node String or join copy
+                let mut out = String::with_capacity(nodes.len() * 72 + 32);
+                let _ = write!(out, "{} node(s) registered:", nodes.len());
                 for n in &nodes {
-                    lines.push(format!(
-                        "  - {} [status={}, health={}, type={}, installed={}, built={}]",
+                    let _ = write!(
+                        out,
+                        "\n  - {} [status={}, health={}, type={}, installed={}, built={}]",
                         n.name, n.status, n.health, n.node_type, n.installed, n.is_built,
-                    ));
+                    );
                 }
-                lines.join("\n")
+                out
             }
             Err(e) => format!("Failed to list nodes: {}", e),
         }
@@ -1111,23 +1128,55 @@ impl<P: PlatformOperations> Dispatcher<P> {
             return ToolResult::error(e);
         }
 
-        match tokio::fs::read_to_string(&path).await {
-            Ok(content) => {
-                let lines: Vec<&str> = content.lines().collect();
-                let max_lines = 500;
-                if lines.len() > max_lines {
-                    let truncated: String = lines[..max_lines].join("\n");
-                    ToolResult::success(format!(
-                        "{}\n\n[Truncated: showing {}/{} lines]",
-                        truncated,
-                        max_lines,
-                        lines.len()
-                    ))
-                } else {
-                    ToolResult::success(content)
-                }
+        // Bounded read — the 500-line cap below only limits what is shown,
+        // so without a byte cap a huge on-disk file would still be pulled
+        // fully into memory first.
+        const MAX_READ_BYTES: u64 = 1024 * 1024;
+        use tokio::io::AsyncReadExt;
+        let file = match tokio::fs::File::open(&path).await {
+            Ok(f) => f,
+            Err(e) => return ToolResult::error(format!("Error reading file: {}", e)),
+        };
+        let mut buf = Vec::new();
+        if let Err(e) = file.take(MAX_READ_BYTES + 1).read_to_end(&mut buf).await {
+            return ToolResult::error(format!("Error reading file: {}", e));
+        }
+        let byte_truncated = buf.len() as u64 > MAX_READ_BYTES;
+        if byte_truncated {
+            buf.truncate(MAX_READ_BYTES as usize);
+        }
+        let content = match std::str::from_utf8(&buf) {
+            Ok(s) => s.to_string(),
+            Err(e) if byte_truncated && buf.len() - e.valid_up_to() < 4 => {
+                // The byte cap split a multi-byte character — drop the tail
+                buf.truncate(e.valid_up_to());
+                String::from_utf8(buf).unwrap_or_default()
             }
-            Err(e) => ToolResult::error(format!("Error reading file: {}", e)),
+            Err(_) => {
+                return ToolResult::error(format!(
+                    "Error reading file: {} is not valid UTF-8",
+                    path.display()
+                ))
+            }
+        };
+
+        let lines: Vec<&str> = content.lines().collect();
+        let max_lines = 500;
+        if lines.len() > max_lines {
+            let truncated: String = lines[..max_lines].join("\n");
+            ToolResult::success(format!(
+                "{}\n\n[Truncated: showing {}/{} lines]",
+                truncated,
+                max_lines,
+                lines.len()
+            ))
+        } else if byte_truncated {
+            ToolResult::success(format!(
+                "{}\n\n[Truncated: showing first {} bytes]",
+                content, MAX_READ_BYTES
+            ))
+        } else {
+            ToolResult::success(content)
         }
     }
 
@@ -1749,7 +1798,7 @@ mod tests {
     #[test]
     fn tool_definitions_have_required_fields() {
         let defs = Dispatcher::<crate::mcp::platform::DaemonPlatform>::tool_definitions();
-        for def in &defs {
+        for def in defs {
             assert!(!def.name.is_empty());
             assert!(!def.description.is_empty());
             assert!(def.input_schema.is_object());
@@ -1760,7 +1809,7 @@ mod tests {
     fn tool_definition_names_unique() {
         let defs = Dispatcher::<crate::mcp::platform::DaemonPlatform>::tool_definitions();
         let mut seen = HashSet::new();
-        for def in &defs {
+        for def in defs {
             assert!(seen.insert(def.name.clone()), "duplicate: {}", def.name);
         }
     }
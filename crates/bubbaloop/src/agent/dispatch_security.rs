@@ -16,14 +16,21 @@ pub(crate) fn expand_home(path: &str) -> PathBuf {
 }
 
 /// Returns the agent workspace directory, creating it if needed.
-pub(crate) fn workspace_dir() -> PathBuf {
-    let dir = dirs::home_dir()
-        .unwrap_or_else(|| PathBuf::from("/tmp"))
-        .join(".bubbaloop")
-        .join("workspace");
-    // Best-effort create
-    let _ = std::fs::create_dir_all(&dir);
-    dir
+///
+/// Resolved (and best-effort created) once per process — this runs on every
+/// write validation and rm scoping check, and the home lookup plus
+/// create_dir_all would otherwise repeat on each call.
+pub(crate) fn workspace_dir() -> &'static Path {
+    static WORKSPACE_DIR: std::sync::LazyLock<PathBuf> = std::sync::LazyLock::new(|| {
+        let dir = dirs::home_dir()
+            .unwrap_or_else(|| PathBuf::from("/tmp"))
+            .join(".bubbaloop")
+            .join("workspace");
+        // Best-effort create
+        let _ = std::fs::create_dir_all(&dir);
+        dir
+    });
+    &WORKSPACE_DIR
 }
 
 /// Block reads of sensitive files (secrets, keys, credentials, system internals).
@@ -40,48 +47,31 @@ pub(crate) fn validate_read_path(path: &Path) -> Result<(), String> {
 
     let name = resolved.file_name().and_then(|n| n.to_str()).unwrap_or("");
 
-    const SENSITIVE_NAMES: &[&str] = &[
+    // Sensitive names and extensions resolve via `match` — a length check
+    // plus one comparison chain — instead of a linear scan over every entry.
+    match name {
         // SSH keys
-        "id_rsa",
-        "id_ed25519",
-        "id_ecdsa",
-        "id_dsa",
-        "authorized_keys",
-        "known_hosts",
+        "id_rsa" | "id_ed25519" | "id_ecdsa" | "id_dsa" | "authorized_keys" | "known_hosts"
         // System files
-        "shadow",
-        "sudoers",
-        "master.key",
+        | "shadow" | "sudoers" | "master.key"
         // Credential files
-        "credentials",
-        "credentials.json",
-        "token.json",
-        "mcp-token",
-        "anthropic-key",
-        "oauth-credentials.json",
+        | "credentials" | "credentials.json" | "token.json" | "mcp-token" | "anthropic-key"
+        | "oauth-credentials.json"
         // Package manager auth
-        ".npmrc",
-        ".netrc",
-        ".pypirc",
-    ];
-
-    const SENSITIVE_EXTENSIONS: &[&str] = &[
-        ".pem",
-        ".key",
-        ".p12",
-        ".pfx",
-        ".jks",
-        ".keystore",
-        ".truststore",
-    ];
-
-    if SENSITIVE_NAMES.contains(&name) {
-        return Err(format!("Blocked: {} is a sensitive file", name));
+        | ".npmrc" | ".netrc" | ".pypirc" => {
+            return Err(format!("Blocked: {} is a sensitive file", name));
+        }
+        _ => {}
     }
 
-    for ext in SENSITIVE_EXTENSIONS {
-        if name.ends_with(ext) {
-            return Err(format!("Blocked: {} files may contain secrets", ext));
+    // Every sensitive extension starts at the last dot, so one rfind
+    // replaces an ends_with pass per pattern.
+    if let Some(ext) = name.rfind('.').map(|dot| &name[dot..]) {
+        match ext {
+            ".pem" | ".key" | ".p12" | ".pfx" | ".jks" | ".keystore" | ".truststore" => {
+                return Err(format!("Blocked: {} files may contain secrets", ext));
+            }
+            _ => {}
         }
     }
 
@@ -137,7 +127,7 @@ pub(crate) fn validate_write_path(path: &Path) -> Result<(), String> {
         path.to_path_buf()
     };
 
-    if !check_path.starts_with(&workspace) {
+    if !check_path.starts_with(workspace) {
         return Err(format!(
             "Blocked: writes are scoped to {}. Use that directory for agent files.",
             workspace.display()
@@ -192,45 +182,53 @@ fn validate_kill_args(args: &[&str]) -> Result<(), String> {
     Ok(())
 }
 
+/// Commands blocked in any position — power management, system config,
+/// user management, and init control. Shared between the first-command
+/// check in `validate_command` and the pipe-segment check below so the
+/// two lists can't drift apart.
+const BLOCKED_SYSTEM_COMMANDS: &[&str] = &[
+    // Power management
+    "shutdown",
+    "reboot",
+    "halt",
+    "poweroff",
+    // Name-based process killing (too broad — matches unrelated processes)
+    "killall",
+    "pkill",
+    // System config
+    "iptables",
+    "ip6tables",
+    "nft",
+    "mount",
+    "umount",
+    "fdisk",
+    "parted",
+    "cfdisk",
+    // User management
+    "useradd",
+    "userdel",
+    "usermod",
+    "passwd",
+    "groupadd",
+    "groupdel",
+    // Init control
+    "init",
+    "telinit",
+];
+
+/// Commands blocked only inside pipe segments, where the first-command
+/// checks (numeric-PID kill validation, meta-command and interpreter
+/// checks) don't apply.
+const PIPE_ONLY_BLOCKED_COMMANDS: &[&str] = &[
+    // kill blocked in pipe segments — only safe as first command with numeric PIDs
+    "kill", "eval", "exec", "source", "sudo", "su", "sh", "bash", "zsh", "dash",
+];
+
 /// Check a single command word against the blocked commands list.
 /// Used for pipe segment validation — `kill` is blocked in pipes (use as first command only).
 fn validate_single_command_word(cmd_base: &str) -> Result<(), String> {
-    const BLOCKED_COMMANDS: &[&str] = &[
-        "shutdown",
-        "reboot",
-        "halt",
-        "poweroff",
-        // kill blocked in pipe segments — only safe as first command with numeric PIDs
-        "kill",
-        "killall",
-        "pkill",
-        "iptables",
-        "ip6tables",
-        "nft",
-        "mount",
-        "umount",
-        "fdisk",
-        "parted",
-        "cfdisk",
-        "useradd",
-        "userdel",
-        "usermod",
-        "passwd",
-        "groupadd",
-        "groupdel",
-        "init",
-        "telinit",
-        "eval",
-        "exec",
-        "source",
-        "sudo",
-        "su",
-        "sh",
-        "bash",
-        "zsh",
-        "dash",
-    ];
-    if BLOCKED_COMMANDS.contains(&cmd_base) {
+    if BLOCKED_SYSTEM_COMMANDS.contains(&cmd_base) || PIPE_ONLY_BLOCKED_COMMANDS.contains(&cmd_base)
+    {
         return Err(format!("Blocked: '{}' requires manual execution", cmd_base));
     }
     Ok(())
@@ -368,39 +366,11 @@ pub(crate) fn validate_command(command: &str) -> Result<(), String> {
         return validate_kill_args(&args);
     }
 
-    const BLOCKED_COMMANDS: &[&str] = &[
-        // Power management
-        "shutdown",
-        "reboot",
-        "halt",
-        "poweroff",
-        // Name-based process killing (too broad — matches unrelated processes)
-        "killall",
-        "pkill",
-        // System config
-        "iptables",
-        "ip6tables",
-        "nft",
-        "mount",
-        "umount",
-        "fdisk",
-        "parted",
-        "cfdisk",
-        // User management
-        "useradd",
-        "userdel",
-        "usermod",
-        "passwd",
-        "groupadd",
-        "groupdel",
-        // Init control
-        "init",
-        "telinit",
-    ];
-    for blocked in BLOCKED_COMMANDS {
-        if first_cmd == *blocked {
-            return Err(format!("Blocked: '{}' requires manual execution", blocked));
-        }
+    if BLOCKED_SYSTEM_COMMANDS.contains(&first_cmd) {
+        return Err(format!(
+            "Blocked: '{}' requires manual execution",
+            first_cmd
+        ));
     }
 
     // ── 4. Service management (protect existing platform) ───────
@@ -7,6 +7,7 @@
 use chrono::SecondsFormat;
 use rusqlite::{params, Connection};
 use serde::{Deserialize, Serialize};
+use std::cell::RefCell;
 use std::fs::OpenOptions;
 use std::io::Write;
 use std::path::{Path, PathBuf};
@@ -46,6 +47,12 @@ pub struct EpisodicLog {
     log_dir: PathBuf,
     /// SQLite connection for FTS5 index.
     conn: Connection,
+    /// Most recent `role = "plan"` entry, kept in step with appends so the
+    /// per-turn `latest_plan()` lookup skips its 100-row scan. `None` means
+    /// "unknown" (cold start, or after forget/prune) — fall back to SQL.
+    plan_cache: RefCell<Option<LogEntry>>,
+    /// Same for the most recent `CONTEXT_FLUSH:` entry and `latest_flush()`.
+    flush_cache: RefCell<Option<LogEntry>>,
 }
 
 impl EpisodicLog {
@@ -104,53 +111,104 @@ impl EpisodicLog {
         Ok(Self {
             log_dir: log_dir.to_path_buf(),
             conn,
+            plan_cache: RefCell::new(None),
+            flush_cache: RefCell::new(None),
         })
     }
 
     /// Append an entry — dual-writes to NDJSON file + FTS5 index.
     pub fn append(&self, entry: &LogEntry) -> super::Result<()> {
-        // 1. Write to NDJSON file
-        let date = entry.timestamp.get(..10).unwrap_or("unknown"); // YYYY-MM-DD
-        let filename = format!("daily_logs_{}.jsonl", date);
-        let path = self.log_dir.join(filename);
-
-        let mut file = OpenOptions::new().create(true).append(true).open(&path)?;
-
-        let json_line = serde_json::to_string(entry)?;
-        writeln!(file, "{}", json_line)?;
-
-        // 2. Write to FTS5 index
-        let fts_id = entry
-            .id
-            .clone()
-            .unwrap_or_else(|| uuid::Uuid::new_v4().to_string());
-        self.conn.execute(
-            "INSERT INTO fts_episodic (content, id, role, timestamp, job_id) \
-             VALUES (?1, ?2, ?3, ?4, ?5)",
-            params![
-                entry.content,
-                fts_id,
-                entry.role,
-                entry.timestamp,
-                entry.job_id.as_deref().unwrap_or(""),
-            ],
-        )?;
+        self.append_many(std::slice::from_ref(entry))
+    }
 
-        // 3. If the entry has an explicit id, write causal metadata
-        if entry.id.is_some() {
-            let rowid_ref = self.conn.last_insert_rowid();
-            self.conn.execute(
+    /// Append multiple entries in one pass.
+    ///
+    /// Opens each daily NDJSON file once (instead of once per entry) and
+    /// wraps all FTS5/metadata inserts in a single transaction, so batched
+    /// appends (e.g. all tool results of a turn) cost one fsync + one commit.
+    pub fn append_many(&self, entries: &[LogEntry]) -> super::Result<()> {
+        if entries.is_empty() {
+            return Ok(());
+        }
+
+        // 1. Write to NDJSON files — one buffered handle per daily file.
+        let mut writer: Option<(String, std::io::BufWriter<std::fs::File>)> = None;
+        for entry in entries {
+            let date = entry.timestamp.get(..10).unwrap_or("unknown"); // YYYY-MM-DD
+            let reopen = writer.as_ref().is_none_or(|(d, _)| d != date);
+            if reopen {
+                if let Some((_, mut w)) = writer.take() {
+                    w.flush()?;
+                }
+                let path = self.log_dir.join(format!("daily_logs_{}.jsonl", date));
+                let file = OpenOptions::new().create(true).append(true).open(&path)?;
+                writer = Some((date.to_string(), std::io::BufWriter::new(file)));
+            }
+            let (_, file) = writer.as_mut().expect("writer opened above");
+            let json_line = serde_json::to_string(entry)?;
+            writeln!(file, "{}", json_line)?;
+        }
+        if let Some((_, mut w)) = writer {
+            w.flush()?;
+        }
+
+        // 2. Write to FTS5 index (+ causal metadata) in one transaction.
+        // prepare_cached: these run on every turn, so reuse compiled statements.
+        let tx = self.conn.unchecked_transaction()?;
+        {
+            let mut insert_fts = tx.prepare_cached(
+                "INSERT INTO fts_episodic (content, id, role, timestamp, job_id) \
+                 VALUES (?1, ?2, ?3, ?4, ?5)",
+            )?;
+            let mut insert_meta = tx.prepare_cached(
                 "INSERT INTO episodic_meta (id, rowid_ref, cause_id, salience, mission_id, timestamp) \
                  VALUES (?1, ?2, ?3, ?4, ?5, ?6)",
-                params![
+            )?;
+            for entry in entries {
+                let fts_id = entry
+                    .id
+                    .clone()
+                    .unwrap_or_else(|| uuid::Uuid::new_v4().to_string());
+                insert_fts.execute(params![
+                    entry.content,
                     fts_id,
-                    rowid_ref,
-                    entry.cause_id,
-                    entry.salience,
-                    entry.mission_id,
+                    entry.role,
                     entry.timestamp,
-                ],
-            )?;
+                    entry.job_id.as_deref().unwrap_or(""),
+                ])?;
+
+                // If the entry has an explicit id, write causal metadata
+                if entry.id.is_some() {
+                    let rowid_ref = tx.last_insert_rowid();
+                    insert_meta.execute(params![
+                        fts_id,
+                        rowid_ref,
+                        entry.cause_id,
+                        entry.salience,
+                        entry.mission_id,
+                        entry.timestamp,
+                    ])?;
+                }
+            }
+        }
+        tx.commit()?;
+
+        // 3. Keep the latest-plan/latest-flush caches in step. Entries are
+        // appended in order, so a later plan unconditionally wins (matching
+        // the rowid DESC scan); flushes are compared by timestamp.
+        for entry in entries {
+            if entry.role == "plan" {
+                *self.plan_cache.borrow_mut() = Some(entry.clone());
+            }
+            if entry.content.starts_with(FLUSH_PREFIX) {
+                let mut cached = self.flush_cache.borrow_mut();
+                if cached
+                    .as_ref()
+                    .is_none_or(|c| entry.timestamp >= c.timestamp)
+                {
+                    *cached = Some(entry.clone());
+                }
+            }
         }
 
         Ok(())
@@ -166,7 +224,7 @@ impl EpisodicLog {
             return Ok(Vec::new());
         }
 
-        let mut stmt = self.conn.prepare(
+        let mut stmt = self.conn.prepare_cached(
             "SELECT content, role, timestamp, job_id \
              FROM fts_episodic \
              WHERE fts_episodic MATCH ?1 \
@@ -225,7 +283,7 @@ impl EpisodicLog {
         // Over-fetch 3x to have enough candidates after re-ranking
         let fetch_limit = limit * 3;
 
-        let mut stmt = self.conn.prepare(
+        let mut stmt = self.conn.prepare_cached(
             "SELECT content, role, timestamp, job_id, rank \
              FROM fts_episodic \
              WHERE fts_episodic MATCH ?1 \
@@ -318,7 +376,7 @@ impl EpisodicLog {
         }
 
         // Find matching entries
-        let mut stmt = self.conn.prepare(
+        let mut stmt = self.conn.prepare_cached(
             "SELECT content, role, timestamp, job_id, rowid \
              FROM fts_episodic \
              WHERE fts_episodic MATCH ?1",
@@ -366,11 +424,19 @@ impl EpisodicLog {
             rowids.push(*rowid);
         }
 
-        // Hard-delete from FTS5
-        for rowid in &rowids {
-            self.conn
-                .execute("DELETE FROM fts_episodic WHERE rowid = ?1", params![rowid])?;
+        // Hard-delete from FTS5 — one cached statement, one transaction.
+        let tx = self.conn.unchecked_transaction()?;
+        {
+            let mut delete = tx.prepare_cached("DELETE FROM fts_episodic WHERE rowid = ?1")?;
+            for rowid in &rowids {
+                delete.execute(params![rowid])?;
+            }
         }
+        tx.commit()?;
+
+        // Deleted entries may include the cached plan/flush — rescan on next lookup.
+        self.plan_cache.borrow_mut().take();
+        self.flush_cache.borrow_mut().take();
 
         let count = rowids.len();
         log::info!(
@@ -414,8 +480,12 @@ impl EpisodicLog {
                 .and_then(|s| s.strip_suffix(".jsonl"))
             {
                 if date < cutoff_date.as_str() {
-                    // Read file before deleting to extract content for FTS5 cleanup
-                    let file_content = std::fs::read_to_string(entry.path()).ok();
+                    // Stream the file before deleting to extract content for
+                    // FTS5 cleanup — a year-old daily log can be large, so
+                    // read it line by line instead of into one String.
+                    let reader = std::fs::File::open(entry.path())
+                        .map(std::io::BufReader::new)
+                        .ok();
 
                     // Delete NDJSON file
                     if let Err(e) = std::fs::remove_file(entry.path()) {
@@ -425,14 +495,16 @@ impl EpisodicLog {
 
                     // Delete corresponding FTS5 entries by matching content from the file.
                     // Uses AND matching (implicit in FTS5) to avoid collateral deletion.
-                    if let Some(contents) = file_content {
-                        for line in contents.lines() {
-                            if let Ok(log_entry) = serde_json::from_str::<LogEntry>(line) {
+                    if let Some(reader) = reader {
+                        use std::io::BufRead;
+                        for line in reader.lines() {
+                            let Ok(line) = line else { break };
+                            if let Ok(log_entry) = serde_json::from_str::<LogEntry>(&line) {
                                 let query = fts5_and_query(&log_entry.content);
                                 if query.is_empty() {
                                     continue;
                                 }
-                                if let Ok(mut stmt) = self.conn.prepare(
+                                if let Ok(mut stmt) = self.conn.prepare_cached(
                                     "SELECT rowid FROM fts_episodic WHERE fts_episodic MATCH ?1",
                                 ) {
                                     let rowids: Vec<i64> = stmt
@@ -441,11 +513,13 @@ impl EpisodicLog {
                                         .flatten()
                                         .flatten()
                                         .collect();
-                                    for rowid in rowids {
-                                        let _ = self.conn.execute(
-                                            "DELETE FROM fts_episodic WHERE rowid = ?1",
-                                            params![rowid],
-                                        );
+                                    if let Ok(mut delete) = self
+                                        .conn
+                                        .prepare_cached("DELETE FROM fts_episodic WHERE rowid = ?1")
+                                    {
+                                        for rowid in rowids {
+                                            let _ = delete.execute(params![rowid]);
+                                        }
                                     }
                                 }
                             }
@@ -458,6 +532,12 @@ impl EpisodicLog {
             }
         }
 
+        if pruned > 0 {
+            // Pruned entries may include the cached plan/flush — rescan on next lookup.
+            self.plan_cache.borrow_mut().take();
+            self.flush_cache.borrow_mut().take();
+        }
+
         Ok(pruned)
     }
 
@@ -466,9 +546,13 @@ impl EpisodicLog {
     /// Plans are stored with `role = "plan"` by the agent turn loop when the model
     /// outputs both text (reasoning) and tool calls (execution) in the same response.
     pub fn latest_plan(&self) -> super::Result<Option<LogEntry>> {
-        // FTS5 UNINDEXED columns can't be reliably filtered with WHERE in all
-        // SQLite versions. Fetch recent entries and filter in Rust.
-        let mut stmt = self.conn.prepare(
+        if let Some(plan) = self.plan_cache.borrow().as_ref() {
+            return Ok(Some(plan.clone()));
+        }
+
+        // Cold start — FTS5 UNINDEXED columns can't be reliably filtered with
+        // WHERE in all SQLite versions. Fetch recent entries and filter in Rust.
+        let mut stmt = self.conn.prepare_cached(
             "SELECT content, id, role, timestamp, job_id \
              FROM fts_episodic \
              ORDER BY rowid DESC \
@@ -495,6 +579,7 @@ impl EpisodicLog {
         for row in rows {
             let entry = row?;
             if entry.role == "plan" {
+                *self.plan_cache.borrow_mut() = Some(entry.clone());
                 return Ok(Some(entry));
             }
         }
@@ -507,8 +592,12 @@ impl EpisodicLog {
     /// After compaction, the agent can recover this context to maintain continuity.
     /// Flush entries are identified by the `CONTEXT_FLUSH:` prefix in their content.
     pub fn latest_flush(&self) -> super::Result<Option<LogEntry>> {
-        // Search FTS5 for the flush marker token, then filter by prefix.
-        let mut stmt = self.conn.prepare(
+        if let Some(flush) = self.flush_cache.borrow().as_ref() {
+            return Ok(Some(flush.clone()));
+        }
+
+        // Cold start — search FTS5 for the flush marker token, then filter by prefix.
+        let mut stmt = self.conn.prepare_cached(
             "SELECT content, role, timestamp, job_id \
              FROM fts_episodic \
              WHERE fts_episodic MATCH '\"CONTEXT_FLUSH\"' \
@@ -545,6 +634,9 @@ impl EpisodicLog {
                 best = Some(entry);
             }
         }
+        if best.is_some() {
+            *self.flush_cache.borrow_mut() = best.clone();
+        }
         Ok(best)
     }
 
@@ -597,7 +689,7 @@ impl EpisodicLog {
 
     /// Retrieve the causal chain: all entries whose cause_id matches the given id.
     pub fn causal_chain(&self, cause_id: &str) -> super::Result<Vec<LogEntry>> {
-        let mut stmt = self.conn.prepare(
+        let mut stmt = self.conn.prepare_cached(
             "SELECT f.content, f.role, f.timestamp, f.job_id, m.id, m.cause_id, m.salience, m.mission_id \
              FROM episodic_meta m \
              JOIN fts_episodic f ON f.rowid = m.rowid_ref \
@@ -704,6 +796,40 @@ mod tests {
         assert_eq!(lines.len(), 5);
     }
 
+    #[test]
+    fn append_many_batches_entries() {
+        let (log, dir) = test_episodic();
+        let entries: Vec<LogEntry> = (0..3)
+            .map(|i| LogEntry {
+                timestamp: "2026-03-03T10:00:00Z".to_string(),
+                role: "tool".to_string(),
+                content: format!("batched result {}", i),
+                ..Default::default()
+            })
+            .chain(std::iter::once(LogEntry {
+                timestamp: "2026-03-04T10:00:00Z".to_string(),
+                role: "tool".to_string(),
+                content: "next day result".to_string(),
+                ..Default::default()
+            }))
+            .collect();
+        log.append_many(&entries).unwrap();
+
+        let day1 =
+            std::fs::read_to_string(dir.path().join("logs/daily_logs_2026-03-03.jsonl")).unwrap();
+        assert_eq!(day1.lines().count(), 3);
+        let day2 =
+            std::fs::read_to_string(dir.path().join("logs/daily_logs_2026-03-04.jsonl")).unwrap();
+        assert_eq!(day2.lines().count(), 1);
+
+        // All entries searchable via FTS5
+        let results = log.search("batched", 10).unwrap();
+        assert_eq!(results.len(), 3);
+
+        // Empty batch is a no-op
+        log.append_many(&[]).unwrap();
+    }
+
     #[test]
     fn daily_rotation() {
         let (log, dir) = test_episodic();
@@ -1063,6 +1189,23 @@ mod tests {
         assert!(log.latest_plan().unwrap().is_none());
     }
 
+    #[test]
+    fn latest_plan_cache_invalidated_by_forget() {
+        let (log, _dir) = test_episodic();
+        log.append(&LogEntry {
+            timestamp: "2026-03-03T10:00:00Z".to_string(),
+            role: "plan".to_string(),
+            content: "deploy zigbee bridge".to_string(),
+            ..Default::default()
+        })
+        .unwrap();
+
+        // Populate the cache, then forget the entry backing it
+        assert!(log.latest_plan().unwrap().is_some());
+        assert_eq!(log.forget("zigbee", "test cleanup").unwrap(), 1);
+        assert!(log.latest_plan().unwrap().is_none());
+    }
+
     #[test]
     fn latest_flush_returns_none_when_empty() {
         let (log, _dir) = test_episodic();
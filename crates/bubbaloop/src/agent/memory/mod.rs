@@ -1,6 +1,6 @@
 //! 3-tier memory model — short-term (RAM), episodic (NDJSON + FTS5), semantic (SQLite).
 //!
-//! - **Tier 1 (Short-term):** `Vec<Message>` for the active turn, cleared after job completion.
+//! - **Tier 1 (Short-term):** `VecDeque<Message>` ring buffer for the active turn, cleared after job completion.
 //! - **Tier 2 (Episodic):** NDJSON daily log files + FTS5 dual-write index.
 //! - **Tier 3 (Semantic):** SQLite tables for jobs and proposals.
 
@@ -9,6 +9,7 @@ pub mod semantic;
 
 use crate::agent::provider::Message;
 use chrono::SecondsFormat;
+use std::collections::VecDeque;
 use std::path::Path;
 use std::sync::Arc;
 
@@ -51,8 +52,9 @@ impl MemoryBackend {
 
 /// Unified memory facade combining all three tiers.
 pub struct Memory {
-    /// Tier 1: Short-term conversation messages (RAM).
-    pub short_term: Vec<Message>,
+    /// Tier 1: Short-term conversation messages (RAM). A `VecDeque` so the
+    /// per-turn trim pops from the front without shifting the rest.
+    pub short_term: VecDeque<Message>,
     /// Tier 2+3: Episodic + semantic backend behind Arc<Mutex>.
     pub backend: Arc<tokio::sync::Mutex<MemoryBackend>>,
 }
@@ -71,7 +73,7 @@ impl Memory {
         let episodic = episodic::EpisodicLog::new(&log_dir, &db_path)?;
 
         Ok(Self {
-            short_term: Vec::new(),
+            short_term: VecDeque::new(),
             backend: Arc::new(tokio::sync::Mutex::new(MemoryBackend {
                 episodic,
                 semantic,
@@ -136,7 +138,7 @@ mod tests {
     fn clear_short_term() {
         let dir = tempfile::tempdir().unwrap();
         let mut mem = Memory::open(dir.path()).unwrap();
-        mem.short_term.push(Message::user("hello"));
+        mem.short_term.push_back(Message::user("hello"));
         assert_eq!(mem.short_term.len(), 1);
         mem.clear_short_term();
         assert!(mem.short_term.is_empty());
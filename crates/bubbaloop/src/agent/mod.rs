@@ -26,6 +26,7 @@ use crate::agent::memory::episodic::EpisodicLog;
 use crate::agent::memory::Memory;
 use crate::agent::provider::{ContentBlock, Message, ModelProvider, StreamEvent, ToolCall, Usage};
 use crate::agent::soul::Soul;
+use futures::stream::{FuturesOrdered, StreamExt};
 use std::collections::HashMap;
 use std::hash::{Hash, Hasher};
 use std::sync::Arc;
@@ -100,17 +101,50 @@ const TOOL_CALL_TIMEOUT_SECS: u64 = 30;
 /// Maximum characters in a tool result before truncation.
 const MAX_TOOL_RESULT_CHARS: usize = 4096;
 
-/// Compute a u64 hash key for a (tool_name, input_json) pair.
-fn tool_call_hash(name: &str, input: &serde_json::Value) -> u64 {
+/// Compute a u64 hash key for a (tool_name, serialized input) pair.
+///
+/// Takes the input pre-serialized — the caller also needs the JSON text for
+/// the tool-event preview, so each input is serialized exactly once per call.
+fn tool_call_hash(name: &str, input_json: &str) -> u64 {
     let mut hasher = std::collections::hash_map::DefaultHasher::new();
     name.hash(&mut hasher);
     // Canonical JSON string ensures identical inputs produce identical hashes
-    serde_json::to_string(input)
-        .unwrap_or_default()
-        .hash(&mut hasher);
+    input_json.hash(&mut hasher);
     hasher.finish()
 }
 
+/// Dispatch one tool call with the per-call timeout. Used by the turn loop's
+/// incremental dispatcher so tool execution overlaps the response stream.
+async fn dispatch_tool_call<P: crate::mcp::platform::PlatformOperations>(
+    dispatcher: &Dispatcher<P>,
+    tc: ToolCall,
+) -> ContentBlock {
+    match tokio::time::timeout(
+        Duration::from_secs(TOOL_CALL_TIMEOUT_SECS),
+        dispatcher.call_tool(&tc.id, &tc.name, &tc.input),
+    )
+    .await
+    {
+        Ok(r) => r,
+        Err(_elapsed) => {
+            log::warn!(
+                "[Agent] Tool '{}' timed out after {}s",
+                tc.name,
+                TOOL_CALL_TIMEOUT_SECS
+            );
+            let content = format!(
+                "Error: tool '{}' timed out after {}s",
+                tc.name, TOOL_CALL_TIMEOUT_SECS
+            );
+            ContentBlock::ToolResult {
+                tool_use_id: tc.id,
+                content,
+                is_error: Some(true),
+            }
+        }
+    }
+}
+
 /// Per-call input for `run_agent_turn`, grouping the request-specific parameters.
 pub struct AgentTurnInput<'a> {
     pub user_input: Option<&'a str>,
@@ -202,8 +236,12 @@ pub async fn run_agent_turn<
     let user_input = input.user_input;
     let job_id = input.job_id;
     let correlation_id = input.correlation_id;
-    // 1. Build system prompt
-    let inventory = dispatcher.get_node_inventory().await;
+    // 1. Build system prompt. Node inventory and the telemetry summary are
+    // independent queries — run them concurrently instead of back-to-back.
+    let (inventory, resource_summary) = tokio::join!(
+        dispatcher.get_node_inventory(),
+        dispatcher.telemetry_prompt_summary()
+    );
     let (active_jobs, relevant_episodes, recent_plan, recovered_context, world_state) = {
         let backend = memory.backend.lock().await;
         let active_jobs = backend.semantic.pending_jobs().unwrap_or_default();
@@ -272,7 +310,6 @@ pub async fn run_agent_turn<
             .await;
     }
 
-    let resource_summary = dispatcher.telemetry_prompt_summary().await;
     let system_prompt = prompt::build_system_prompt_with_soul_path(
         soul,
         &inventory,
@@ -287,7 +324,7 @@ pub async fn run_agent_turn<
 
     // Add user input to short-term memory
     if let Some(input) = user_input {
-        memory.short_term.push(Message::user(input));
+        memory.short_term.push_back(Message::user(input));
         // Log to episodic
         let entry = EpisodicLog::make_entry("user", input, job_id);
         let backend = memory.backend.lock().await;
@@ -308,7 +345,7 @@ pub async fn run_agent_turn<
             &TurnContext {
                 soul,
                 system_prompt: &system_prompt,
-                tools: &tools,
+                tools,
             },
             sink,
             input,
@@ -380,8 +417,9 @@ async fn run_turn_loop<
             .await;
         }
         // Stream response from provider (retry handled inside ClaudeProvider)
+        let messages = memory.short_term.make_contiguous();
         let mut rx = match provider
-            .generate_stream(Some(system_prompt), &memory.short_term, tools)
+            .generate_stream(Some(system_prompt), messages, tools)
             .await
         {
             Ok(r) => r,
@@ -401,28 +439,100 @@ async fn run_turn_loop<
         };
         let mut _stop_reason: Option<String> = None;
 
-        while let Some(event) = rx.recv().await {
-            match event {
-                StreamEvent::TextDelta(delta) => {
-                    sink.emit(AgentEvent::delta(correlation_id, &delta)).await;
-                    text_buffer.push_str(&delta);
-                }
-                StreamEvent::ToolUse { id, name, input } => {
-                    tool_calls.push(ToolCall { id, name, input });
-                }
-                StreamEvent::Done {
-                    usage,
-                    stop_reason: sr,
-                } => {
-                    stream_usage = usage;
-                    _stop_reason = sr;
+        // Tool calls dispatch as soon as their ToolUse block arrives, so
+        // execution overlaps the tail of the stream instead of waiting for
+        // Done. FuturesOrdered keeps results in dispatch order, lining them
+        // up with the tool_use blocks. Once a loop is detected, later calls
+        // in the same response are recorded but not dispatched.
+        let mut pending = FuturesOrdered::new();
+        let mut results: Vec<ContentBlock> = Vec::new();
+        let mut loop_break_hit = false;
+
+        loop {
+            tokio::select! {
+                event = rx.recv() => {
+                    let Some(event) = event else { break };
+                    match event {
+                        StreamEvent::TextDelta(delta) => {
+                            sink.emit(AgentEvent::delta(correlation_id, &delta)).await;
+                            text_buffer.push_str(&delta);
+                        }
+                        StreamEvent::ToolUse { id, name, input } => {
+                            // Serialize once — both the loop-detection hash
+                            // and the tool-event preview need the JSON text.
+                            let input_json = serde_json::to_string(&input).unwrap_or_default();
+                            let call_key = tool_call_hash(&name, &input_json);
+                            let count = tool_call_counts.entry(call_key).or_insert(0);
+                            *count += 1;
+                            if *count == LOOP_WARN_THRESHOLD {
+                                log::warn!(
+                                    "[Agent] Repeated tool call detected: {} ({}x)",
+                                    name,
+                                    LOOP_WARN_THRESHOLD
+                                );
+                            }
+                            if !loop_detected && *count >= LOOP_BREAK_THRESHOLD {
+                                sink.emit(AgentEvent::error(
+                                    correlation_id,
+                                    &format!(
+                                        "loop detected: {} called {}x with same args, stopping",
+                                        name, count
+                                    ),
+                                ))
+                                .await;
+                                loop_detected = true;
+                                loop_break_hit = true;
+                            }
+                            if !loop_detected {
+                                let input_preview: Option<String> = if input.is_null()
+                                    || input == serde_json::Value::Object(Default::default())
+                                {
+                                    None
+                                } else if input_json.len() > 200 {
+                                    Some(format!("{}…", &input_json[..200]))
+                                } else {
+                                    Some(input_json)
+                                };
+                                sink.emit(AgentEvent::tool(
+                                    correlation_id,
+                                    &name,
+                                    input_preview.as_deref(),
+                                ))
+                                .await;
+                                log::info!("[Agent] calling tool: {}", name);
+                                pending.push_back(dispatch_tool_call(
+                                    dispatcher,
+                                    ToolCall {
+                                        id: id.clone(),
+                                        name: name.clone(),
+                                        input: input.clone(),
+                                    },
+                                ));
+                            }
+                            tool_calls.push(ToolCall { id, name, input });
+                        }
+                        StreamEvent::Done {
+                            usage,
+                            stop_reason: sr,
+                        } => {
+                            stream_usage = usage;
+                            _stop_reason = sr;
+                        }
+                        StreamEvent::Error(e) => {
+                            log::error!("Stream error: {}", e);
+                            break;
+                        }
+                    }
                 }
-                StreamEvent::Error(e) => {
-                    log::error!("Stream error: {}", e);
-                    break;
+                Some(result) = pending.next(), if !pending.is_empty() => {
+                    results.push(result);
                 }
             }
         }
+        // Stream closed — drain any tool calls still running.
+        while let Some(result) = pending.next().await {
+            results.push(result);
+        }
         if !text_buffer.is_empty() {
             // StdoutSink handles its own newline via Delta events; for Zenoh
             // the client renders newlines. Emit a final empty delta for newline.
@@ -431,12 +541,24 @@ async fn run_turn_loop<
 
         last_input_tokens = stream_usage.input_tokens;
 
-        // Build assistant message from streamed content
-        let mut content_blocks = Vec::new();
+        // Episodic entries for the text, built before the buffer is moved into
+        // the assistant message. Plan detection: if model outputs BOTH text AND
+        // tool calls, the text is likely a plan/reasoning (Ralph Loop: Plan →
+        // Execute) — persist it too, batched into the same append.
+        let mut entries = Vec::new();
         if !text_buffer.is_empty() {
-            content_blocks.push(ContentBlock::Text {
-                text: text_buffer.clone(),
-            });
+            entries.push(EpisodicLog::make_entry("assistant", &text_buffer, job_id));
+            if !tool_calls.is_empty() {
+                entries.push(EpisodicLog::make_entry("plan", &text_buffer, job_id));
+            }
+        }
+
+        // Build assistant message from streamed content — the text buffer is
+        // moved, not copied.
+        let mut content_blocks =
+            Vec::with_capacity(usize::from(!text_buffer.is_empty()) + tool_calls.len());
+        if !text_buffer.is_empty() {
+            content_blocks.push(ContentBlock::Text { text: text_buffer });
         }
         for tc in &tool_calls {
             content_blocks.push(ContentBlock::ToolUse {
@@ -449,134 +571,65 @@ async fn run_turn_loop<
             role: "assistant".to_string(),
             content: content_blocks,
         };
-        memory.short_term.push(assistant_msg);
+        memory.short_term.push_back(assistant_msg);
 
-        // Log text to episodic
-        let text = text_buffer;
-        if !text.is_empty() {
-            let entry = EpisodicLog::make_entry("assistant", &text, job_id);
+        if !entries.is_empty() {
             let backend = memory.backend.lock().await;
-            if let Err(e) = backend.episodic.append(&entry) {
+            if let Err(e) = backend.episodic.append_many(&entries) {
                 log::warn!("Failed to log assistant message to episodic: {}", e);
             }
         }
 
-        // Check for tool calls
-
-        // Plan detection: if model outputs BOTH text AND tool calls, the text is
-        // likely a plan/reasoning (Ralph Loop: Plan → Execute). Persist it.
-        if !text.is_empty() && !tool_calls.is_empty() {
-            let plan_entry = EpisodicLog::make_entry("plan", &text, job_id);
-            let backend = memory.backend.lock().await;
-            if let Err(e) = backend.episodic.append(&plan_entry) {
-                log::warn!("Failed to persist plan to episodic: {}", e);
-            }
+        // Loop-break advisory goes after the assistant message, matching the
+        // conversation order the model expects.
+        if loop_break_hit {
+            memory.short_term.push_back(Message::user(&format!(
+                "SYSTEM: Loop detected — you've called the same tool {} times with identical \
+                     arguments. Stop repeating and summarize what you've accomplished so far.",
+                LOOP_BREAK_THRESHOLD
+            )));
         }
 
+        // Check for tool calls
+
         if tool_calls.is_empty() {
             break; // Text-only response, turn complete
         }
 
-        // Dispatch tool calls
-        let mut tool_results = Vec::new();
-        for tc in &tool_calls {
-            // Loop detection: hash (name, input) and count duplicates
-            let call_key = tool_call_hash(&tc.name, &tc.input);
-            let count = tool_call_counts.entry(call_key).or_insert(0);
-            *count += 1;
-            if *count == LOOP_WARN_THRESHOLD {
-                log::warn!(
-                    "[Agent] Repeated tool call detected: {} ({}x)",
-                    tc.name,
-                    LOOP_WARN_THRESHOLD
-                );
-            }
-            if *count >= LOOP_BREAK_THRESHOLD {
-                sink.emit(AgentEvent::error(
-                    correlation_id,
-                    &format!(
-                        "loop detected: {} called {}x with same args, stopping",
-                        tc.name, count
-                    ),
-                ))
-                .await;
-                memory.short_term.push(Message::user(&format!(
-                    "SYSTEM: Loop detected — you've called the same tool {} times with identical \
-                         arguments. Stop repeating and summarize what you've accomplished so far.",
-                    LOOP_BREAK_THRESHOLD
-                )));
-                loop_detected = true;
-                break;
-            }
-
-            let input_preview: Option<String> = if tc.input.is_null()
-                || tc.input == serde_json::Value::Object(Default::default())
-            {
-                None
-            } else {
-                let s = tc.input.to_string();
-                Some(if s.len() > 200 {
-                    format!("{}…", &s[..200])
-                } else {
-                    s
-                })
-            };
-            sink.emit(AgentEvent::tool(
-                correlation_id,
-                &tc.name,
-                input_preview.as_deref(),
-            ))
-            .await;
-            log::info!("[Agent] calling tool: {}", tc.name);
-
-            // All tools dispatched through the Dispatcher (memory tools included)
-            let result = match tokio::time::timeout(
-                Duration::from_secs(TOOL_CALL_TIMEOUT_SECS),
-                dispatcher.call_tool(&tc.id, &tc.name, &tc.input),
-            )
-            .await
-            {
-                Ok(r) => r,
-                Err(_elapsed) => {
-                    log::warn!(
-                        "[Agent] Tool '{}' timed out after {}s",
-                        tc.name,
-                        TOOL_CALL_TIMEOUT_SECS
-                    );
-                    ContentBlock::ToolResult {
-                        tool_use_id: tc.id.clone(),
-                        content: format!(
-                            "Error: tool '{}' timed out after {}s",
-                            tc.name, TOOL_CALL_TIMEOUT_SECS
-                        ),
-                        is_error: Some(true),
-                    }
-                }
-            };
-
+        let mut tool_results = Vec::with_capacity(results.len());
+        let mut episodic_entries = Vec::with_capacity(results.len());
+        for result in results {
             if let ContentBlock::ToolResult {
                 tool_use_id,
                 content,
                 is_error,
-            } = &result
+            } = result
             {
                 // Truncate large tool results to prevent context blow-up
                 let content = truncate_tool_result(content);
-                tool_results.push((tool_use_id.clone(), content.clone(), *is_error));
-                // Log tool result to episodic
-                let entry = EpisodicLog::make_entry("tool", &content, job_id);
-                let backend = memory.backend.lock().await;
-                if let Err(e) = backend.episodic.append(&entry) {
-                    log::warn!("Failed to log tool result to episodic: {}", e);
-                }
-                // Emit result so CLI --verbose can display it
-                sink.emit(AgentEvent::tool_result(correlation_id, &content))
-                    .await;
+                episodic_entries.push(EpisodicLog::make_entry("tool", &content, job_id));
+                tool_results.push((tool_use_id, content, is_error));
             }
         }
 
+        // Log tool results to episodic — one batched append for the whole turn
+        if !episodic_entries.is_empty() {
+            let backend = memory.backend.lock().await;
+            if let Err(e) = backend.episodic.append_many(&episodic_entries) {
+                log::warn!("Failed to log tool results to episodic: {}", e);
+            }
+        }
+
+        // Emit results so CLI --verbose can display them
+        for (_, content, _) in &tool_results {
+            sink.emit(AgentEvent::tool_result(correlation_id, content))
+                .await;
+        }
+
         // Add tool results to short-term memory
-        memory.short_term.push(Message::tool_results(tool_results));
+        memory
+            .short_term
+            .push_back(Message::tool_results(tool_results));
     }
 
     // 2.5. Pre-compaction flush (design Section 5.5)
@@ -599,10 +652,13 @@ async fn run_turn_loop<
             "SYSTEM: Context window is approaching capacity. Persist any important state \
              to memory before context compaction. Summarize: active proposals, node health \
              assessments, unresolved decisions, and key reasoning. Be concise.";
-        memory.short_term.push(Message::user(flush_instruction));
+        memory
+            .short_term
+            .push_back(Message::user(flush_instruction));
 
+        let messages = memory.short_term.make_contiguous();
         if let Ok(flush_response) = provider
-            .generate(Some(system_prompt), &memory.short_term, tools)
+            .generate(Some(system_prompt), messages, tools)
             .await
         {
             let flush_text = flush_response.text();
@@ -687,15 +743,17 @@ fn sanitize_dangling_tool_use(memory: &mut Memory) {
         })
         .collect();
 
-    memory.short_term.push(Message::tool_results(results));
+    memory.short_term.push_back(Message::tool_results(results));
 }
 
 /// Truncate a tool result string if it exceeds `MAX_TOOL_RESULT_CHARS`.
 ///
 /// Uses char-boundary-safe slicing to avoid panicking on multi-byte UTF-8.
-fn truncate_tool_result(content: &str) -> String {
+/// Takes ownership so the common (short) case passes the string through
+/// without copying.
+fn truncate_tool_result(content: String) -> String {
     if content.len() <= MAX_TOOL_RESULT_CHARS {
-        content.to_string()
+        content
     } else {
         // Find the nearest char boundary at or before the limit
         let end = (0..=MAX_TOOL_RESULT_CHARS)
@@ -809,7 +867,7 @@ mod tests {
 
     #[test]
     fn loop_detection_identical_calls_same_hash() {
-        let input = serde_json::json!({"node": "camera"});
+        let input = serde_json::json!({"node": "camera"}).to_string();
         let h1 = tool_call_hash("list_nodes", &input);
         let h2 = tool_call_hash("list_nodes", &input);
         assert_eq!(h1, h2, "identical tool calls must produce the same hash");
@@ -817,8 +875,8 @@ mod tests {
 
     #[test]
     fn loop_detection_different_inputs_different_hash() {
-        let input_a = serde_json::json!({"node": "camera"});
-        let input_b = serde_json::json!({"node": "weather"});
+        let input_a = serde_json::json!({"node": "camera"}).to_string();
+        let input_b = serde_json::json!({"node": "weather"}).to_string();
         let h1 = tool_call_hash("list_nodes", &input_a);
         let h2 = tool_call_hash("list_nodes", &input_b);
         assert_ne!(h1, h2, "different inputs must produce different hashes");
@@ -826,7 +884,7 @@ mod tests {
 
     #[test]
     fn loop_detection_different_tools_different_hash() {
-        let input = serde_json::json!({});
+        let input = serde_json::json!({}).to_string();
         let h1 = tool_call_hash("list_nodes", &input);
         let h2 = tool_call_hash("get_health", &input);
         assert_ne!(h1, h2, "different tool names must produce different hashes");
@@ -853,19 +911,19 @@ mod tests {
     #[test]
     fn truncate_short_content_unchanged() {
         let short = "Hello, world!";
-        assert_eq!(truncate_tool_result(short), short);
+        assert_eq!(truncate_tool_result(short.to_string()), short);
     }
 
     #[test]
     fn truncate_exact_limit_unchanged() {
         let exact = "a".repeat(MAX_TOOL_RESULT_CHARS);
-        assert_eq!(truncate_tool_result(&exact), exact);
+        assert_eq!(truncate_tool_result(exact.clone()), exact);
     }
 
     #[test]
     fn truncate_over_limit_adds_suffix() {
         let long = "x".repeat(MAX_TOOL_RESULT_CHARS + 100);
-        let result = truncate_tool_result(&long);
+        let result = truncate_tool_result(long.clone());
         assert!(result.len() < long.len() + 100); // truncated + suffix
         assert!(result.starts_with(&"x".repeat(MAX_TOOL_RESULT_CHARS)));
         assert!(result.contains("[Output truncated at"));
@@ -945,7 +1003,7 @@ mod tests {
         let mut memory = Memory::open(dir.path()).unwrap();
 
         // Push an assistant message with two tool_use blocks (no tool_results after)
-        memory.short_term.push(Message {
+        memory.short_term.push_back(Message {
             role: "assistant".to_string(),
             content: vec![
                 ContentBlock::ToolUse {
@@ -964,7 +1022,7 @@ mod tests {
         sanitize_dangling_tool_use(&mut memory);
 
         // A tool_results message should have been appended
-        let last = memory.short_term.last().unwrap();
+        let last = memory.short_term.back().unwrap();
         assert_eq!(last.role, "user");
         let ids: Vec<_> = last
             .content
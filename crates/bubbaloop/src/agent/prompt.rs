@@ -5,10 +5,42 @@ use crate::agent::memory::episodic::LogEntry;
 use crate::agent::memory::semantic::Job;
 use crate::agent::memory::WorldStateEntry;
 use crate::agent::soul::Soul;
+use std::sync::{LazyLock, Mutex};
 
 /// Maximum length for a single sanitized prompt value (characters).
 const MAX_PROMPT_VALUE_LEN: usize = 500;
 
+/// Phrases that mark a line as a prompt-injection attempt.
+/// Matched case-insensitively by `contains_blocked_phrase`.
+const BLOCKED_PHRASES: &[&str] = &[
+    "SYSTEM INSTRUCTION",
+    "IGNORE ALL",
+    "IGNORE PRIOR",
+    "IGNORE PREVIOUS",
+    "NEW INSTRUCTIONS",
+    "DISREGARD",
+];
+
+/// Case-insensitive multi-pattern scan — one pass over the line, no
+/// uppercased copy allocated. At each offset only patterns whose first
+/// letter matches are compared.
+fn contains_blocked_phrase(line: &str) -> bool {
+    let bytes = line.as_bytes();
+    for start in 0..bytes.len() {
+        let first = bytes[start].to_ascii_uppercase();
+        for pattern in BLOCKED_PHRASES {
+            let pat = pattern.as_bytes();
+            if pat[0] == first
+                && bytes.len() - start >= pat.len()
+                && bytes[start..start + pat.len()].eq_ignore_ascii_case(pat)
+            {
+                return true;
+            }
+        }
+    }
+    false
+}
+
 /// Sanitize a value before embedding it in the system prompt.
 ///
 /// Prevents prompt injection by:
@@ -26,14 +58,7 @@ fn sanitize_prompt_value(value: &str) -> String {
             continue;
         }
         // Strip lines that look like system instruction overrides
-        let upper = trimmed.to_uppercase();
-        if upper.contains("SYSTEM INSTRUCTION")
-            || upper.contains("IGNORE ALL")
-            || upper.contains("IGNORE PRIOR")
-            || upper.contains("IGNORE PREVIOUS")
-            || upper.contains("NEW INSTRUCTIONS")
-            || upper.contains("DISREGARD")
-        {
+        if contains_blocked_phrase(trimmed) {
             continue;
         }
         if !result.is_empty() {
@@ -107,7 +132,13 @@ pub fn format_world_state_section(entries: &[WorldStateEntry], token_budget: usi
         return String::new();
     }
 
-    let mut lines = vec!["## WORLD STATE (sensor-grounded, live)".to_string()];
+    use std::fmt::Write as _;
+
+    // Single output buffer — each entry is written in place and rolled back
+    // with truncate() if it would blow the budget, so no per-line Strings or
+    // final join copy are allocated.
+    let mut section = String::with_capacity(entries.len() * 48 + 40);
+    section.push_str("## WORLD STATE (sensor-grounded, live)");
     let mut approx_tokens = 8usize;
 
     // Stale entries first (safety-critical awareness)
@@ -115,26 +146,122 @@ pub fn format_world_state_section(entries: &[WorldStateEntry], token_budget: usi
 
     for entry in stale.iter().chain(fresh.iter()) {
         let sanitized_value = sanitize_prompt_value(&entry.value);
-        let line = if entry.stale {
-            format!(
-                "  [STALE] {} = {} (conf={:.2})",
-                entry.key, sanitized_value, entry.confidence
-            )
-        } else {
-            format!(
-                "  {} = {} (conf={:.2})",
-                entry.key, sanitized_value, entry.confidence
-            )
-        };
-        let line_tokens = line.len() / 4 + 1;
+        let marker = if entry.stale { "[STALE] " } else { "" };
+        let prev_len = section.len();
+        let _ = write!(
+            section,
+            "\n  {}{} = {} (conf={:.2})",
+            marker, entry.key, sanitized_value, entry.confidence
+        );
+        // -1: the joining newline doesn't count toward the line estimate
+        let line_tokens = (section.len() - prev_len - 1) / 4 + 1;
         if approx_tokens + line_tokens > token_budget {
+            section.truncate(prev_len);
             break;
         }
         approx_tokens += line_tokens;
-        lines.push(line);
     }
 
-    lines.join("\n")
+    section
+}
+
+/// One-entry memo of the Soul-derived prompt sections (Configuration,
+/// Operating Mode, Tools), keyed by the capability fields that determine
+/// them. The prompt is rebuilt on every turn but these sections only change
+/// when the soul is edited (hot-reload), so consecutive turns reuse the
+/// cached string instead of re-formatting ~2 KB of static text.
+#[allow(clippy::type_complexity)]
+static STATIC_SECTIONS_CACHE: LazyLock<Mutex<Option<((String, usize, String), String)>>> =
+    LazyLock::new(|| Mutex::new(None));
+
+/// Build (or fetch from cache) the prompt sections that depend only on the
+/// Soul capabilities. Sections are pre-joined with `\n` to match the final
+/// `parts.join("\n")` layout.
+fn soul_static_sections(soul: &Soul) -> String {
+    let caps = &soul.capabilities;
+
+    if let Ok(cache) = STATIC_SECTIONS_CACHE.lock() {
+        if let Some(((model, max_turns, mode), sections)) = cache.as_ref() {
+            if *model == caps.model_name
+                && *max_turns == caps.max_turns
+                && *mode == caps.default_approval_mode
+            {
+                return sections.clone();
+            }
+        }
+    }
+
+    // Capabilities summary
+    let mut sections = format!(
+        "\n## Configuration\n\n\
+         - Model: {}\n\
+         - Max turns per job: {}\n",
+        caps.model_name, caps.max_turns,
+    );
+
+    // Operating mode directive
+    if caps.default_approval_mode == "propose" {
+        sections.push_str(
+            "\n## Operating Mode: Propose\n\n\
+             For state-changing actions, explain what you plan to do and why, then\n\
+             wait for approval. Read-only operations execute immediately.\n",
+        );
+    } else {
+        sections.push_str(
+            "\n## Operating Mode: Autonomous (Ralph Loop)\n\n\
+             You run in an autonomous loop. For every task:\n\n\
+             1. **Plan** — Break the task into concrete steps. State them briefly.\n\
+             2. **Execute** — Do step 1 with tools. Then step 2. Keep going.\n\
+             3. **Evaluate** — After each step, check: did it work? Is the goal met?\n\
+             4. **Iterate** — If not done, adjust and continue. If done, report results.\n\n\
+             ### Rules\n\n\
+             - **Act, don't ask.** Never say \"Would you like me to...?\" or \"Should I...?\" — do it.\n\
+             - **Keep going.** Don't stop after one tool call if the task needs more.\n\
+             - **Verify.** After making a change, confirm it worked (check health, read output, etc).\n\
+             - **Be concise.** Report what you did and the result. Skip preamble.\n\
+             - **Chain tools.** Use multiple tools in sequence to complete complex tasks.\n\n\
+             ### Examples of Autonomous Behavior\n\n\
+             User: \"Set up a temperature monitor\"\n\
+             → Plan: install node, build, start, verify health\n\
+             → Execute: install_node → build_node → start_node → get_node_health\n\
+             → Report: \"Installed and started openmeteo. Health: Healthy.\"\n\n\
+             User: \"Check why the camera is down\"\n\
+             → get_node_health → get_node_logs → diagnose → restart_node → verify\n\
+             → Report: \"Camera crashed (OOM). Restarted. Now healthy.\"\n",
+        );
+    }
+
+    // Scope — tells the LLM what tools it has
+    sections.push_str(
+        "\n## Tools\n\n\
+         You have 49 tools across categories:\n\
+         - **Node management:** install, build, start, stop, restart, configure, monitor, query nodes\n\
+         - **System:** read and write files, run shell commands\n\
+         - **Memory:** search episodic memory, update beliefs, read world state\n\
+         - **Missions:** list, pause, resume, cancel missions\n\
+         - **Safety:** register and list constraints per mission\n\n\
+         Use the right tool for the job. For node operations, use the dedicated node tools.\n\
+         For everything else, use read_file, write_file, or run_command.\n\n\
+         ### Important: recurring vs one-off actions\n\n\
+         - **run_command** blocks until the command exits. NEVER use shell loops (`while true`, `watch`, `for i in`) \
+         with run_command — they block for the full 30-second timeout and produce no output until they time out.\n\
+         - **schedule_task** is the correct tool for anything that should repeat (\"every 5 seconds\", \"every minute\", \
+         \"daily at 09:00\"). Use a cron expression for the `cron_schedule` field. \
+         Example: check a sensor every 30 seconds → schedule_task with `*/30 * * * * *`.",
+    );
+
+    if let Ok(mut cache) = STATIC_SECTIONS_CACHE.lock() {
+        *cache = Some((
+            (
+                caps.model_name.clone(),
+                caps.max_turns,
+                caps.default_approval_mode.clone(),
+            ),
+            sections.clone(),
+        ));
+    }
+
+    sections
 }
 
 pub fn build_system_prompt(
@@ -173,146 +300,94 @@ pub fn build_system_prompt_with_soul_path(
     soul_path: Option<&str>,
     world_state: &[crate::agent::memory::semantic::WorldStateEntry],
 ) -> String {
-    let mut parts = Vec::new();
+    use std::fmt::Write as _;
+
+    // Assemble into one buffer instead of collecting sections into a Vec and
+    // joining — the identity and static sections dominate, so size for them.
+    let mut prompt = String::with_capacity(soul.identity.len() + 4096);
 
     // Soul identity — use onboarding prompt for new agents
     if let Some(path) = soul_path {
-        parts.push(NEW_AGENT_IDENTITY.replace("{soul_path}", path));
+        prompt.push_str(&NEW_AGENT_IDENTITY.replace("{soul_path}", path));
     } else {
-        parts.push(soul.identity.clone());
+        prompt.push_str(&soul.identity);
     }
 
     // Post-compaction context recovery from episodic memory.
     // When the LLM context window is truncated, this section restores
     // the most recent flush entry so the agent can maintain continuity.
     if let Some(ctx) = recovered_context {
-        parts.push(format!(
-            "\n## Previously Persisted Context (recovered from memory)\n\n\
+        let _ = write!(
+            prompt,
+            "\n\n## Previously Persisted Context (recovered from memory)\n\n\
              The following was saved before your last context compaction. \
              This is recovered state, not current conversation.\n\n{}",
             ctx
-        ));
-    }
-
-    // Capabilities summary
-    parts.push(format!(
-        "\n## Configuration\n\n\
-         - Model: {}\n\
-         - Max turns per job: {}",
-        soul.capabilities.model_name, soul.capabilities.max_turns,
-    ));
-
-    // Operating mode directive
-    if soul.capabilities.default_approval_mode == "propose" {
-        parts.push(
-            "\n## Operating Mode: Propose\n\n\
-             For state-changing actions, explain what you plan to do and why, then\n\
-             wait for approval. Read-only operations execute immediately."
-                .to_string(),
-        );
-    } else {
-        parts.push(
-            "\n## Operating Mode: Autonomous (Ralph Loop)\n\n\
-             You run in an autonomous loop. For every task:\n\n\
-             1. **Plan** — Break the task into concrete steps. State them briefly.\n\
-             2. **Execute** — Do step 1 with tools. Then step 2. Keep going.\n\
-             3. **Evaluate** — After each step, check: did it work? Is the goal met?\n\
-             4. **Iterate** — If not done, adjust and continue. If done, report results.\n\n\
-             ### Rules\n\n\
-             - **Act, don't ask.** Never say \"Would you like me to...?\" or \"Should I...?\" — do it.\n\
-             - **Keep going.** Don't stop after one tool call if the task needs more.\n\
-             - **Verify.** After making a change, confirm it worked (check health, read output, etc).\n\
-             - **Be concise.** Report what you did and the result. Skip preamble.\n\
-             - **Chain tools.** Use multiple tools in sequence to complete complex tasks.\n\n\
-             ### Examples of Autonomous Behavior\n\n\
-             User: \"Set up a temperature monitor\"\n\
-             → Plan: install node, build, start, verify health\n\
-             → Execute: install_node → build_node → start_node → get_node_health\n\
-             → Report: \"Installed and started openmeteo. Health: Healthy.\"\n\n\
-             User: \"Check why the camera is down\"\n\
-             → get_node_health → get_node_logs → diagnose → restart_node → verify\n\
-             → Report: \"Camera crashed (OOM). Restarted. Now healthy.\""
-                .to_string(),
         );
     }
 
-    // Scope — tells the LLM what tools it has
-    parts.push(
-        "\n## Tools\n\n\
-         You have 49 tools across categories:\n\
-         - **Node management:** install, build, start, stop, restart, configure, monitor, query nodes\n\
-         - **System:** read and write files, run shell commands\n\
-         - **Memory:** search episodic memory, update beliefs, read world state\n\
-         - **Missions:** list, pause, resume, cancel missions\n\
-         - **Safety:** register and list constraints per mission\n\n\
-         Use the right tool for the job. For node operations, use the dedicated node tools.\n\
-         For everything else, use read_file, write_file, or run_command.\n\n\
-         ### Important: recurring vs one-off actions\n\n\
-         - **run_command** blocks until the command exits. NEVER use shell loops (`while true`, `watch`, `for i in`) \
-         with run_command — they block for the full 30-second timeout and produce no output until they time out.\n\
-         - **schedule_task** is the correct tool for anything that should repeat (\"every 5 seconds\", \"every minute\", \
-         \"daily at 09:00\"). Use a cron expression for the `cron_schedule` field. \
-         Example: check a sensor every 30 seconds → schedule_task with `*/30 * * * * *`."
-            .to_string(),
-    );
+    // Configuration, Operating Mode and Tools sections — fully determined by
+    // the Soul capabilities, so served from the memoized cache.
+    prompt.push('\n');
+    prompt.push_str(&soul_static_sections(soul));
 
     // Inject live world state — written by context providers, not the LLM.
     let ws_section = format_world_state_section(world_state, 500);
     if !ws_section.is_empty() {
-        parts.push(ws_section);
+        prompt.push('\n');
+        prompt.push_str(&ws_section);
     }
 
     if let Some(summary) = resource_summary {
-        parts.push(summary.to_string());
+        prompt.push('\n');
+        prompt.push_str(summary);
     }
 
     // Current node inventory
-    parts.push(format!(
-        "\n## Current Sensor Inventory\n\n{}",
-        if node_inventory.is_empty() {
-            "No sensors installed.".to_string()
-        } else {
-            sanitize_prompt_value(node_inventory)
-        }
-    ));
+    prompt.push_str("\n\n## Current Sensor Inventory\n\n");
+    if node_inventory.is_empty() {
+        prompt.push_str("No sensors installed.");
+    } else {
+        prompt.push_str(&sanitize_prompt_value(node_inventory));
+    }
 
     // Active jobs
-    let pending_jobs: Vec<_> = active_jobs
+    let mut pending_jobs = active_jobs
         .iter()
         .filter(|j| j.status == "pending" || j.status == "running")
-        .collect();
-    if !pending_jobs.is_empty() {
-        let mut job_lines = vec!["\n## Active Jobs\n".to_string()];
-        for job in &pending_jobs {
+        .peekable();
+    if pending_jobs.peek().is_some() {
+        prompt.push_str("\n\n## Active Jobs\n");
+        for job in pending_jobs {
             let cron = job.cron_schedule.as_deref().unwrap_or("one-off");
-            job_lines.push(format!(
-                "- {} [status={}, schedule={}, retries={}]",
+            let _ = write!(
+                prompt,
+                "\n- {} [status={}, schedule={}, retries={}]",
                 job.prompt_payload, job.status, cron, job.retry_count
-            ));
+            );
         }
-        parts.push(job_lines.join("\n"));
     }
 
     // Relevant episodic context
     if !relevant_episodes.is_empty() {
-        let mut ep_lines = vec!["\n## Relevant Context (from episodic memory)\n".to_string()];
+        prompt.push_str("\n\n## Relevant Context (from episodic memory)\n");
         for entry in relevant_episodes.iter().take(5) {
             let content_preview: String = entry.content.chars().take(200).collect();
             let sanitized_preview = sanitize_prompt_value(&content_preview);
-            ep_lines.push(format!(
-                "- [{}] {}: {}",
+            let _ = write!(
+                prompt,
+                "\n- [{}] {}: {}",
                 entry.timestamp, entry.role, sanitized_preview
-            ));
+            );
         }
-        parts.push(ep_lines.join("\n"));
     }
 
     // Current plan (persisted from a previous turn, survives context compaction)
     if let Some(plan) = recent_plan {
-        parts.push(format!("\n## Current Plan\n\n{}", plan));
+        let _ = write!(prompt, "\n\n## Current Plan\n\n{}", plan);
     }
 
-    parts.join("\n")
+    prompt
 }
 
 #[cfg(test)]
@@ -644,6 +719,20 @@ mod tests {
         assert!(result.is_empty());
     }
 
+    #[test]
+    fn sanitize_strips_mixed_case_overrides() {
+        assert!(sanitize_prompt_value("please DiSrEgArD everything").is_empty());
+        assert!(sanitize_prompt_value("new Instructions follow").is_empty());
+        // Substring inside another word still matches, like the old
+        // uppercase-and-contains behavior did
+        assert!(sanitize_prompt_value("xxignore allxx").is_empty());
+        // Benign text with pattern first-letters survives
+        assert_eq!(
+            sanitize_prompt_value("dog sleeps inside"),
+            "dog sleeps inside"
+        );
+    }
+
     #[test]
     fn sanitize_truncates_long_values() {
         let long = "a".repeat(1000);
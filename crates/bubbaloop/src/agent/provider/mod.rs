@@ -43,16 +43,26 @@ pub const HTTP_REQUEST_TIMEOUT: Duration = Duration::from_secs(150);
 /// the work they were used for.
 pub const HTTP_POOL_IDLE: Duration = Duration::from_secs(30);
 
-/// Build a `reqwest::Client` with the provider-wide timeouts applied.
+/// Return the shared provider HTTP client with the provider-wide timeouts
+/// applied.
 ///
 /// All `ModelProvider` implementations MUST use this — calling
 /// `reqwest::Client::new()` directly is a bug, see the module comment above.
+///
+/// The client is built once per process and cloned out (`reqwest::Client` is
+/// an `Arc` around its connection pool, so clones are cheap and share the
+/// pool). Previously every provider construction built its own client and
+/// therefore its own pool; with several agents configured, requests to the
+/// same backend could not reuse each other's keep-alive connections.
 pub fn http_client() -> reqwest::Client {
-    reqwest::Client::builder()
-        .timeout(HTTP_REQUEST_TIMEOUT)
-        .pool_idle_timeout(HTTP_POOL_IDLE)
-        .build()
-        .expect("reqwest client builder with static config must succeed")
+    static HTTP_CLIENT: std::sync::LazyLock<reqwest::Client> = std::sync::LazyLock::new(|| {
+        reqwest::Client::builder()
+            .timeout(HTTP_REQUEST_TIMEOUT)
+            .pool_idle_timeout(HTTP_POOL_IDLE)
+            .build()
+            .expect("reqwest client builder with static config must succeed")
+    });
+    HTTP_CLIENT.clone()
 }
 
 /// Errors from model provider operations.
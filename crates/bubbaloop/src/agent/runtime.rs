@@ -262,6 +262,11 @@ impl AgentRuntime {
 
         let mut handles = HashMap::new();
 
+        // Track every task spawned below so shutdown can reap them instead of
+        // leaking detached tasks. All of them select on `shutdown_rx` and exit
+        // on their own; the reap below is the backstop for stragglers.
+        let mut tasks: Vec<tokio::task::JoinHandle<()>> = Vec::new();
+
         for (agent_id, entry) in &config.agents {
             if !entry.enabled {
                 log::info!("[Runtime] Agent '{}' is disabled, skipping", agent_id);
@@ -279,7 +284,9 @@ impl AgentRuntime {
             } else {
                 Soul::load_or_default()
             };
-            let soul = Arc::new(RwLock::new(soul));
+            // Arc inside the lock so per-turn snapshots are a pointer clone,
+            // not a copy of the identity text — see agent_loop.
+            let soul = Arc::new(RwLock::new(Arc::new(soul)));
 
             // Initialize provider based on config (claude or ollama)
             // Prefer agents.toml model over Soul capabilities.toml model_name
@@ -333,12 +340,9 @@ impl AgentRuntime {
             // Uses the same memory.db that Memory::open created.
             let belief_db_path = agent_dir.join("memory.db");
             let belief_decay_shutdown = shutdown_rx.clone();
-            tokio::spawn(spawn_belief_decay_task(
-                belief_db_path,
-                0.9,
-                3600,
-                belief_decay_shutdown,
-            ));
+            tasks.push(
+                spawn_belief_decay_task(belief_db_path, 0.9, 3600, belief_decay_shutdown).await,
+            );
 
             // Spawn world_state TTL sweeper — deletes stale rows on a 30s cadence
             // so a one-shot context-provider value can't drive reactive rules
@@ -447,13 +451,17 @@ impl AgentRuntime {
             let manifest_topic = gateway::manifest_topic(&machine_id, agent_id);
             let manifest_json = serde_json::to_vec(&manifest).unwrap_or_default();
             let manifest_session = session.clone();
-            tokio::spawn(async move {
+            let mut manifest_shutdown = shutdown_rx.clone();
+            tasks.push(tokio::spawn(async move {
                 match manifest_session.declare_queryable(&manifest_topic).await {
-                    Ok(queryable) => {
-                        while let Ok(query) = queryable.recv_async().await {
-                            let _ = query.reply(&manifest_topic, manifest_json.clone()).await;
+                    Ok(queryable) => loop {
+                        tokio::select! {
+                            Ok(query) = queryable.recv_async() => {
+                                let _ = query.reply(&manifest_topic, manifest_json.clone()).await;
+                            }
+                            _ = manifest_shutdown.changed() => break,
                         }
-                    }
+                    },
                     Err(e) => {
                         log::warn!(
                             "[Runtime] Failed to register manifest for {}: {}",
@@ -462,7 +470,7 @@ impl AgentRuntime {
                         );
                     }
                 }
-            });
+            }));
 
             // Subscribe to this agent's inbox topic so other agents can send messages.
             // Messages are appended to episodic memory and surface in the next prompt turn.
@@ -471,7 +479,7 @@ impl AgentRuntime {
             let inbox_backend = memory.backend.clone();
             let mut inbox_shutdown = shutdown_rx.clone();
             let inbox_agent_id = agent_id.clone();
-            tokio::spawn(async move {
+            tasks.push(tokio::spawn(async move {
                 match inbox_session.declare_subscriber(&inbox_topic).await {
                     Ok(sub) => {
                         log::info!(
@@ -513,7 +521,7 @@ impl AgentRuntime {
                         e
                     ),
                 }
-            });
+            }));
 
             // Spawn per-agent task
             let agent_id_clone = agent_id.clone();
@@ -524,7 +532,7 @@ impl AgentRuntime {
             // Start soul watcher for this agent
             let soul_dir_clone = soul_dir.clone();
             let soul_for_watcher = soul.clone();
-            tokio::spawn(async move {
+            tasks.push(tokio::spawn(async move {
                 let watch_dir = if soul_dir_clone.join("identity.md").exists() {
                     Some(soul_dir_clone)
                 } else {
@@ -536,7 +544,7 @@ impl AgentRuntime {
                     watch_dir,
                 )
                 .await;
-            });
+            }));
 
             // Spawn mission file watcher — polls agent_dir/missions/ every 5s.
             // New/changed .md files are upserted into MissionStore as Active.
@@ -546,17 +554,17 @@ impl AgentRuntime {
             let missions_db_path = agent_dir.join("missions.db");
             let (mission_tx, mut mission_rx) = tokio::sync::mpsc::channel::<String>(16);
             let mission_watcher_shutdown = shutdown_rx.clone();
-            tokio::spawn(watch_missions_dir(
+            tasks.push(tokio::spawn(watch_missions_dir(
                 missions_dir.clone(),
                 mission_watcher_shutdown,
                 mission_tx,
-            ));
+            )));
 
             // Consume mission IDs and upsert into MissionStore
-            tokio::spawn(async move {
+            tasks.push(tokio::spawn(async move {
                 while let Some(mission_id) = mission_rx.recv().await {
                     let md_path = missions_dir.join(format!("{}.md", mission_id));
-                    let markdown = match std::fs::read_to_string(&md_path) {
+                    let markdown = match tokio::fs::read_to_string(&md_path).await {
                         Ok(s) => s,
                         Err(e) => {
                             log::warn!("[MissionWatcher] Failed to read {}.md: {}", mission_id, e);
@@ -594,14 +602,14 @@ impl AgentRuntime {
                         log::info!("[MissionWatcher] Loaded mission '{}'", mission_id);
                     }
                 }
-            });
+            }));
 
             // First-run onboarding: triggered by a marker file placed by `agent setup`.
             // The marker is removed once the agent writes its own identity.md.
             let onboarding_marker = agent_dir.join(".needs-onboarding");
             let identity_path = soul_dir.join("identity.md");
 
-            tokio::spawn(agent_loop(
+            tasks.push(tokio::spawn(agent_loop(
                 agent_id_clone,
                 provider,
                 dispatcher,
@@ -613,7 +621,7 @@ impl AgentRuntime {
                 job_notify,
                 identity_path,
                 onboarding_marker,
-            ));
+            )));
 
             log::info!(
                 "[Runtime] Agent '{}' ready (default={})",
@@ -679,6 +687,22 @@ impl AgentRuntime {
             }
         }
 
+        // Reap background tasks. Every task selects on `shutdown_rx` and exits
+        // on its own — the grace period only bites when in-flight cleanup
+        // (job state updates, episodic writes) is still running; anything left
+        // after it is aborted.
+        let grace = tokio::time::timeout(
+            std::time::Duration::from_secs(5),
+            futures::future::join_all(tasks.iter_mut()),
+        )
+        .await;
+        if grace.is_err() {
+            log::warn!("[Runtime] Background tasks still running after 5s grace — aborting");
+        }
+        for task in &tasks {
+            task.abort();
+        }
+
         Ok(())
     }
 
@@ -755,7 +779,7 @@ async fn agent_loop(
     provider: AnyProvider,
     dispatcher: Dispatcher<DaemonPlatform>,
     mut memory: Memory,
-    soul: Arc<RwLock<Soul>>,
+    soul: Arc<RwLock<Arc<Soul>>>,
     mut inbox_rx: mpsc::Receiver<AgentMessage>,
     sink: ZenohSink,
     mut shutdown_rx: tokio::sync::watch::Receiver<()>,
@@ -848,7 +872,7 @@ async fn agent_loop(
                 let onboarding_path = if needs_onboarding {
                     if identity_path.exists() {
                         // Agent just wrote identity.md — clear marker and stop onboarding.
-                        let _ = std::fs::remove_file(&onboarding_marker);
+                        let _ = tokio::fs::remove_file(&onboarding_marker).await;
                         needs_onboarding = false;
                         None
                     } else {
@@ -1212,19 +1236,27 @@ fn build_reactive_prompt(fired: &[FiredRule]) -> String {
          If nothing needs doing, acknowledge briefly and stand down.\n\n\
          Fired rules:\n"
     );
+    use std::fmt::Write as _;
     for r in fired {
-        let desc = if r.description.is_empty() {
-            "(no description)".to_string()
-        } else if r.description.chars().count() > MAX_DESC_CHARS {
-            let truncated: String = r.description.chars().take(MAX_DESC_CHARS).collect();
-            format!("{}… (truncated)", truncated)
+        let _ = write!(
+            out,
+            "- {} [mission={}] predicate=`{}` — ",
+            r.id, r.mission_id, r.predicate
+        );
+        if r.description.is_empty() {
+            out.push_str("(no description)");
         } else {
-            r.description.clone()
-        };
-        out.push_str(&format!(
-            "- {} [mission={}] predicate=`{}` — {}\n",
-            r.id, r.mission_id, r.predicate, desc
-        ));
+            // Single pass: locate the byte offset of the char limit instead
+            // of counting every char and then re-collecting on truncation.
+            match r.description.char_indices().nth(MAX_DESC_CHARS) {
+                Some((cut, _)) => {
+                    out.push_str(&r.description[..cut]);
+                    out.push_str("… (truncated)");
+                }
+                None => out.push_str(&r.description),
+            }
+        }
+        out.push('\n');
     }
     out
 }
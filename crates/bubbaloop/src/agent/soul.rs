@@ -388,10 +388,12 @@ fn prompt_with_default(prompt: &str, default: &str) -> std::io::Result<String> {
 
 /// Background task that watches `~/.bubbaloop/soul/` and hot-reloads on changes.
 ///
-/// Updates the shared `Arc<RwLock<Soul>>` when files change.
+/// Updates the shared `Arc<RwLock<Arc<Soul>>>` when files change. The inner
+/// `Arc` is swapped wholesale so readers snapshot the soul with a pointer
+/// clone instead of copying the identity text every turn.
 /// Returns when the shutdown signal fires.
 pub async fn soul_watcher(
-    soul: Arc<RwLock<Soul>>,
+    soul: Arc<RwLock<Arc<Soul>>>,
     mut shutdown: tokio::sync::watch::Receiver<()>,
     watch_dir: Option<std::path::PathBuf>,
 ) {
@@ -441,7 +443,7 @@ pub async fn soul_watcher(
                 log::info!("Soul files changed, reloading...");
                 let new_soul = Soul::load_from_dir(&dir);
                 let mut guard = soul.write().await;
-                *guard = new_soul;
+                *guard = Arc::new(new_soul);
                 log::info!("Soul reloaded successfully");
             }
             _ = shutdown.changed() => {
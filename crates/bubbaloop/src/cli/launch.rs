@@ -244,8 +244,9 @@ impl LaunchCommand {
             if let Some(path) = node_name_matches(&entry.path(), node_name) {
                 return Ok(path);
             }
-            // Check one level of subdirectories (multi-node repos)
-            if !entry.path().is_dir() {
+            // Check one level of subdirectories (multi-node repos).
+            // file_type() is cached from the directory read — no extra stat.
+            if !entry.file_type().map(|t| t.is_dir()).unwrap_or(false) {
                 continue;
             }
             if let Ok(sub_entries) = std::fs::read_dir(entry.path()) {
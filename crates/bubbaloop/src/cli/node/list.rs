@@ -201,7 +201,8 @@ pub(crate) fn discover_nodes_in_subdirs(base_path: &Path) -> Vec<(String, String
         .into_iter()
         .flatten()
         .flatten()
-        .filter(|e| e.path().is_dir())
+        // file_type() comes from the directory read itself — no extra stat per entry
+        .filter(|e| e.file_type().map(|t| t.is_dir()).unwrap_or(false))
         .filter_map(|entry| {
             let yaml_path = entry.path().join("node.yaml");
             let content = std::fs::read_to_string(&yaml_path).ok()?;
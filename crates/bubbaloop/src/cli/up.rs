@@ -284,11 +284,11 @@ pub fn is_node_installed(node_name: &str) -> bool {
         return false;
     };
     for repo_entry in repo_entries.flatten() {
-        let repo_path = repo_entry.path();
-        if !repo_path.is_dir() {
+        // file_type() is cached from the directory read — avoids a stat per entry
+        if !repo_entry.file_type().map(|t| t.is_dir()).unwrap_or(false) {
             continue;
         }
-        let Ok(node_entries) = std::fs::read_dir(&repo_path) else {
+        let Ok(node_entries) = std::fs::read_dir(repo_entry.path()) else {
             continue;
         };
         for node_entry in node_entries.flatten() {
@@ -3,8 +3,11 @@
 //! Manages the nodes.json file that tracks registered nodes.
 
 use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
+use std::sync::{LazyLock, Mutex};
+use std::time::SystemTime;
 use thiserror::Error;
 
 #[derive(Error, Debug)]
@@ -179,10 +182,16 @@ pub struct NodesRegistry {
 }
 
 /// Get the bubbaloop home directory
+///
+/// Resolved once per process — callers hit this on every registry read and
+/// node path lookup, and the home lookup + join never changes.
 pub fn get_bubbaloop_home() -> PathBuf {
-    dirs::home_dir()
-        .unwrap_or_else(|| PathBuf::from("/tmp"))
-        .join(".bubbaloop")
+    static BUBBALOOP_HOME: LazyLock<PathBuf> = LazyLock::new(|| {
+        dirs::home_dir()
+            .unwrap_or_else(|| PathBuf::from("/tmp"))
+            .join(".bubbaloop")
+    });
+    BUBBALOOP_HOME.clone()
 }
 
 /// Get the nodes.json file path
@@ -190,15 +199,42 @@ pub fn get_nodes_file() -> PathBuf {
     get_bubbaloop_home().join("nodes.json")
 }
 
+/// Cache of the parsed nodes.json, invalidated by (mtime, size). The registry
+/// is re-read on every `list_nodes()` — every agent turn and MCP node listing —
+/// but only changes on `node add`/`node remove`. Keyed by path so a changed
+/// HOME can never serve a stale registry. `save_registry()` refreshes the
+/// cache after writing, which also covers same-second rewrites.
+#[allow(clippy::type_complexity)]
+static REGISTRY_CACHE: LazyLock<Mutex<Option<(PathBuf, SystemTime, u64, NodesRegistry)>>> =
+    LazyLock::new(|| Mutex::new(None));
+
 /// Load the nodes registry
 pub fn load_registry() -> Result<NodesRegistry> {
-    let path = get_nodes_file();
-    if !path.exists() {
+    load_registry_from(&get_nodes_file())
+}
+
+fn load_registry_from(path: &Path) -> Result<NodesRegistry> {
+    let Ok(meta) = fs::metadata(path) else {
         return Ok(NodesRegistry::default());
+    };
+    let mtime = meta.modified().unwrap_or(SystemTime::UNIX_EPOCH);
+    let len = meta.len();
+
+    if let Ok(cache) = REGISTRY_CACHE.lock() {
+        if let Some((cached_path, cached_mtime, cached_len, registry)) = cache.as_ref() {
+            if cached_path == path && *cached_mtime == mtime && *cached_len == len {
+                return Ok(registry.clone());
+            }
+        }
     }
 
-    let content = fs::read_to_string(&path)?;
+    let content = fs::read_to_string(path)?;
     let registry: NodesRegistry = serde_json::from_str(&content)?;
+
+    if let Ok(mut cache) = REGISTRY_CACHE.lock() {
+        *cache = Some((path.to_path_buf(), mtime, len, registry.clone()));
+    }
+
     Ok(registry)
 }
 
@@ -224,17 +260,46 @@ pub fn save_registry(registry: &NodesRegistry) -> Result<()> {
         let _ = std::fs::set_permissions(&path, perms);
     }
 
+    // Refresh the cache with what we just wrote so a rewrite within the same
+    // mtime granularity cannot serve the previous contents.
+    if let Ok(meta) = fs::metadata(&path) {
+        if let Ok(mut cache) = REGISTRY_CACHE.lock() {
+            *cache = Some((
+                path,
+                meta.modified().unwrap_or(SystemTime::UNIX_EPOCH),
+                meta.len(),
+                registry.clone(),
+            ));
+        }
+    }
+
     Ok(())
 }
 
+/// Cache of parsed manifests keyed by node.yaml path, invalidated by
+/// (mtime, size). Manifests are re-read constantly — every `list_nodes()`
+/// and every agent node-inventory refresh parses each registered
+/// node.yaml — but the files only change on install or manual edit.
+/// Only valid manifests are cached; invalid ones re-parse (and re-fail).
+#[allow(clippy::type_complexity)]
+static MANIFEST_CACHE: LazyLock<Mutex<HashMap<PathBuf, (SystemTime, u64, NodeManifest)>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
 /// Read the node manifest from a node directory
 pub fn read_manifest(node_path: &Path) -> Result<NodeManifest> {
     let manifest_path = node_path.join("node.yaml");
-    if !manifest_path.exists() {
-        return Err(RegistryError::InvalidNode(format!(
-            "No node.yaml found in {}",
-            node_path.display()
-        )));
+    let meta = fs::metadata(&manifest_path).map_err(|_| {
+        RegistryError::InvalidNode(format!("No node.yaml found in {}", node_path.display()))
+    })?;
+    let mtime = meta.modified().unwrap_or(SystemTime::UNIX_EPOCH);
+    let len = meta.len();
+
+    if let Ok(cache) = MANIFEST_CACHE.lock() {
+        if let Some((cached_mtime, cached_len, manifest)) = cache.get(&manifest_path) {
+            if *cached_mtime == mtime && *cached_len == len {
+                return Ok(manifest.clone());
+            }
+        }
     }
 
     let content = fs::read_to_string(&manifest_path)?;
@@ -243,6 +308,10 @@ pub fn read_manifest(node_path: &Path) -> Result<NodeManifest> {
     // Validate the manifest fields
     manifest.validate()?;
 
+    if let Ok(mut cache) = MANIFEST_CACHE.lock() {
+        cache.insert(manifest_path, (mtime, len, manifest.clone()));
+    }
+
     Ok(manifest)
 }
 
@@ -822,6 +891,75 @@ mod tests {
         assert!(validate_config_override("").is_err());
     }
 
+    #[test]
+    fn test_read_manifest_cache_invalidates_on_change() {
+        let dir = tempfile::tempdir().unwrap();
+        let yaml_v1 = "name: cached-node\nversion: \"1.0.0\"\ntype: rust\ndescription: first\n";
+        std::fs::write(dir.path().join("node.yaml"), yaml_v1).unwrap();
+
+        let m1 = read_manifest(dir.path()).unwrap();
+        assert_eq!(m1.description, "first");
+
+        // Second read hits the cache — same result
+        let m2 = read_manifest(dir.path()).unwrap();
+        assert_eq!(m2.description, "first");
+
+        // Rewriting the file (different size) must invalidate the cache
+        let yaml_v2 =
+            "name: cached-node\nversion: \"1.0.0\"\ntype: rust\ndescription: second version\n";
+        std::fs::write(dir.path().join("node.yaml"), yaml_v2).unwrap();
+        let m3 = read_manifest(dir.path()).unwrap();
+        assert_eq!(m3.description, "second version");
+    }
+
+    #[test]
+    fn test_load_registry_cache_invalidates_on_change() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("nodes.json");
+
+        // Missing file — empty registry, nothing cached
+        let empty = load_registry_from(&path).unwrap();
+        assert!(empty.nodes.is_empty());
+
+        let v1 = NodesRegistry {
+            nodes: vec![NodeEntry {
+                path: "/opt/nodes/one".to_string(),
+                added_at: "1700000000000".to_string(),
+                name_override: None,
+                config_override: None,
+            }],
+        };
+        std::fs::write(&path, serde_json::to_string_pretty(&v1).unwrap()).unwrap();
+
+        let r1 = load_registry_from(&path).unwrap();
+        assert_eq!(r1.nodes.len(), 1);
+
+        // Second read hits the cache — same result
+        let r2 = load_registry_from(&path).unwrap();
+        assert_eq!(r2.nodes.len(), 1);
+
+        // Rewriting the file (different size) must invalidate the cache
+        let mut v2 = v1.clone();
+        v2.nodes.push(NodeEntry {
+            path: "/opt/nodes/two".to_string(),
+            added_at: "1700000001000".to_string(),
+            name_override: None,
+            config_override: None,
+        });
+        std::fs::write(&path, serde_json::to_string_pretty(&v2).unwrap()).unwrap();
+        let r3 = load_registry_from(&path).unwrap();
+        assert_eq!(r3.nodes.len(), 2);
+    }
+
+    #[test]
+    fn test_read_manifest_missing_file() {
+        let dir = tempfile::tempdir().unwrap();
+        assert!(matches!(
+            read_manifest(dir.path()),
+            Err(RegistryError::InvalidNode(_))
+        ));
+    }
+
     // -----------------------------------------------------------------------
     // check_is_built tests
     // -----------------------------------------------------------------------
@@ -106,6 +106,11 @@ pub fn find_template_dir(node_type: &str) -> Result<PathBuf> {
 
 /// Copy template directory to output, processing template variables
 pub fn copy_template(template_dir: &Path, output_dir: &Path, vars: &TemplateVars) -> Result<()> {
+    // Directories already created this run — WalkDir visits files in the
+    // same directory back-to-back, so this skips a create_dir_all (several
+    // syscalls each) for every file after the first in a directory.
+    let mut created_dirs: std::collections::HashSet<PathBuf> = std::collections::HashSet::new();
+
     for entry in WalkDir::new(template_dir) {
         let entry = entry?;
         let src_path = entry.path();
@@ -125,13 +130,19 @@ pub fn copy_template(template_dir: &Path, output_dir: &Path, vars: &TemplateVars
             .replace("{{node_name}}", &vars.node_name);
         let dest_path = output_dir.join(&dest_name);
 
-        if src_path.is_dir() {
+        // walkdir already knows the entry type from the directory read —
+        // src_path.is_dir() would re-stat every entry
+        if entry.file_type().is_dir() {
             fs::create_dir_all(&dest_path)?;
             log::debug!("Created directory: {}", dest_path.display());
+            created_dirs.insert(dest_path);
         } else {
             // Create parent directories if needed
             if let Some(parent) = dest_path.parent() {
-                fs::create_dir_all(parent)?;
+                if !created_dirs.contains(parent) {
+                    fs::create_dir_all(parent)?;
+                    created_dirs.insert(parent.to_path_buf());
+                }
             }
 
             // Read and process template
@@ -147,19 +158,43 @@ pub fn copy_template(template_dir: &Path, output_dir: &Path, vars: &TemplateVars
     Ok(())
 }
 
-/// Process template content, replacing all template variables
+/// Process template content, replacing all template variables.
+///
+/// Single pass over the content — each `{{token}}` is resolved as it is
+/// found, instead of re-scanning (and reallocating) the whole template once
+/// per variable. Unknown tokens are left as-is.
 pub fn process_template(content: &str, vars: &TemplateVars) -> String {
-    content
-        // New node-style variables
-        .replace("{{node_name}}", &vars.node_name)
-        .replace("{{node_name_pascal}}", &vars.node_name_pascal)
-        .replace("{{node_name_snake}}", &vars.node_name_snake)
-        // Legacy plugin-style variables (for backwards compatibility with *-plugin templates)
-        .replace("{{plugin_name}}", &vars.node_name)
-        .replace("{{plugin_name_pascal}}", &vars.node_name_pascal)
-        // Common variables
-        .replace("{{author}}", &vars.author)
-        .replace("{{description}}", &vars.description)
+    let mut out = String::with_capacity(content.len());
+    let mut rest = content;
+    while let Some(start) = rest.find("{{") {
+        let (before, after) = rest.split_at(start);
+        out.push_str(before);
+        let Some(end) = after.find("}}") else {
+            // Unterminated "{{" — emit the remainder verbatim
+            out.push_str(after);
+            rest = "";
+            break;
+        };
+        let value = match &after[2..end] {
+            // New node-style variables (plugin_* kept for backwards
+            // compatibility with *-plugin templates)
+            "node_name" | "plugin_name" => &vars.node_name,
+            "node_name_pascal" | "plugin_name_pascal" => &vars.node_name_pascal,
+            "node_name_snake" => &vars.node_name_snake,
+            "author" => &vars.author,
+            "description" => &vars.description,
+            _ => {
+                // Not a template variable — keep the braces and rescan after them
+                out.push_str("{{");
+                rest = &after[2..];
+                continue;
+            }
+        };
+        out.push_str(value);
+        rest = &after[end + 2..];
+    }
+    out.push_str(rest);
+    out
 }
 
 /// Create a new node from template at a specific path
@@ -1,43 +1,37 @@
 //! Shared input validation for MCP, CLI, and daemon boundaries.
 
-/// Validate a node name: 1-64 chars, `[a-zA-Z0-9_-]` only.
-pub fn validate_node_name(name: &str) -> Result<(), String> {
+/// Shared check for node and rule names: 1-64 bytes, ASCII `[a-zA-Z0-9_-]`
+/// only. Byte-wise so no UTF-8 decoding happens on this per-request path —
+/// and unlike `char::is_alphanumeric`, non-ASCII letters are rejected, which
+/// is what the documented `[a-zA-Z0-9_-]` constraint always promised.
+fn validate_name(name: &str, kind: &str) -> Result<(), String> {
     if name.is_empty() || name.len() > 64 {
         return Err(format!(
-            "Node name must be 1-64 characters, got {}",
+            "{} name must be 1-64 characters, got {}",
+            kind,
             name.len()
         ));
     }
     if !name
-        .chars()
-        .all(|c| c.is_alphanumeric() || c == '-' || c == '_')
+        .bytes()
+        .all(|b| b.is_ascii_alphanumeric() || b == b'-' || b == b'_')
     {
-        return Err(
-            "Node name may only contain alphanumeric characters, hyphens, and underscores"
-                .to_string(),
-        );
+        return Err(format!(
+            "{} name may only contain alphanumeric characters, hyphens, and underscores",
+            kind
+        ));
     }
     Ok(())
 }
 
+/// Validate a node name: 1-64 chars, `[a-zA-Z0-9_-]` only.
+pub fn validate_node_name(name: &str) -> Result<(), String> {
+    validate_name(name, "Node")
+}
+
 /// Validate a rule name: same constraints as node names.
 pub fn validate_rule_name(name: &str) -> Result<(), String> {
-    if name.is_empty() || name.len() > 64 {
-        return Err(format!(
-            "Rule name must be 1-64 characters, got {}",
-            name.len()
-        ));
-    }
-    if !name
-        .chars()
-        .all(|c| c.is_alphanumeric() || c == '-' || c == '_')
-    {
-        return Err(
-            "Rule name may only contain alphanumeric characters, hyphens, and underscores"
-                .to_string(),
-        );
-    }
-    Ok(())
+    validate_name(name, "Rule")
 }
 
 /// Validate a publish topic: must start with `bubbaloop/`, no wildcards, max 256 chars.
@@ -158,6 +152,8 @@ mod tests {
         assert!(validate_node_name("**").is_err());
         assert!(validate_node_name("node;rm").is_err());
         assert!(validate_node_name("../../../etc").is_err());
+        // Non-ASCII letters are outside [a-zA-Z0-9_-]
+        assert!(validate_node_name("café").is_err());
     }
 
     #[test]
@@ -32,6 +32,7 @@ Usage::
         pub.put({"temperature": 22.5})
 """
 
+import functools
 import logging
 import os
 import signal
@@ -353,12 +354,14 @@ class NodeContext:
         if sfx is None:
             return
         try:
+            # functools.partial over a bound method — invoked without the
+            # Python-frame indirection a lambda wrapper would add.
             if is_input:
-                publisher._on_first_fire = lambda s=sfx: self._mark_input_fired(s)
-                publisher._on_undeclare = lambda s=sfx: self._mark_input_undeclared(s)
+                publisher._on_first_fire = functools.partial(self._mark_input_fired, sfx)
+                publisher._on_undeclare = functools.partial(self._mark_input_undeclared, sfx)
             else:
-                publisher._on_first_fire = lambda s=sfx: self._mark_output_fired(s)
-                publisher._on_undeclare = lambda s=sfx: self._mark_output_undeclared(s)
+                publisher._on_first_fire = functools.partial(self._mark_output_fired, sfx)
+                publisher._on_undeclare = functools.partial(self._mark_output_undeclared, sfx)
         except (AttributeError, TypeError):
             return
 
@@ -42,20 +42,30 @@ def _dict_to_namespace(obj):
     return obj
 
 
-def _maybe_unwrap_envelope(decoded):
-    """Return an :class:`Envelope` if ``decoded`` is a `{header, body}` dict
-    (the SDK provenance shape used on both CBOR and JSON topics), otherwise
-    return the value converted via :func:`_dict_to_namespace`.
+def _is_envelope(decoded) -> bool:
+    """True when ``decoded`` has exactly the SDK's ``{header, body}`` shape.
 
     Defensive: requires BOTH keys, ``header`` to be a dict, and the dict to
     have exactly those two top-level keys (so we don't accidentally wrap a
-    user payload that happens to define its own ``header`` field).
+    user payload that happens to define its own ``header`` field). The
+    length + membership checks run on every received message, so no
+    intermediate key set is built.
     """
-    if (
+    return (
         isinstance(decoded, dict)
-        and set(decoded.keys()) == {"header", "body"}
+        and len(decoded) == 2
+        and "header" in decoded
+        and "body" in decoded
         and isinstance(decoded["header"], dict)
-    ):
+    )
+
+
+def _maybe_unwrap_envelope(decoded):
+    """Return an :class:`Envelope` if ``decoded`` is a `{header, body}` dict
+    (the SDK provenance shape used on both CBOR and JSON topics), otherwise
+    return the value converted via :func:`_dict_to_namespace`.
+    """
+    if _is_envelope(decoded):
         return Envelope(
             body=_dict_to_namespace(decoded["body"]),
             header=_dict_to_namespace(decoded["header"]),
@@ -67,11 +77,7 @@ def _maybe_unwrap_envelope_plain(decoded):
     """Like :func:`_maybe_unwrap_envelope` but leaves non-enveloped payloads
     as raw dicts (no ``SimpleNamespace`` conversion). Used for JSON where the
     long-standing contract is to return a plain ``dict``."""
-    if (
-        isinstance(decoded, dict)
-        and set(decoded.keys()) == {"header", "body"}
-        and isinstance(decoded["header"], dict)
-    ):
+    if _is_envelope(decoded):
         return Envelope(
             body=_dict_to_namespace(decoded["body"]),
             header=_dict_to_namespace(decoded["header"]),